@@ -6,42 +6,521 @@ import time
 import random
 import json
 import logging
+import queue
+import atexit
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 import os
 import platform
 import subprocess
 import re
-import psutil # type: ignore
+import functools
+from collections import deque
+import socket
+import select
+import sys
+from email.utils import parsedate_to_datetime
 from selenium import webdriver # type: ignore
 from selenium.webdriver.chrome.options import Options # type: ignore
+from selenium.webdriver.chrome.service import Service # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
 from selenium.common.exceptions import ( # type: ignore
     TimeoutException, 
     ElementClickInterceptedException,
-    NoSuchElementException,
     StaleElementReferenceException,
     WebDriverException
 )
 from selenium.webdriver.common.action_chains import ActionChains # type: ignore
 from selenium.webdriver.common.keys import Keys # type: ignore
 
-# Set up logging
+# Set up logging - records are queued and written by a background thread
+# so log calls in the clipping loop don't block on file/console I/O
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler("coupon_clipper.log", delay=True)
+_log_handlers = [
+    # Write the log file in batches; warnings and errors go out straight away
+    MemoryHandler(100, flushLevel=logging.WARNING, target=_log_file_handler),
+    logging.StreamHandler()
+]
+for _handler in (_log_file_handler, *_log_handlers):
+    _handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("coupon_clipper.log"),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Final formatting is done by the listener's handlers
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger("CouponClipper")
 
+# Split selector lists on commas that aren't inside an attribute selector
+_SELECTOR_SPLIT_RE = re.compile(r',\s*(?![^\[]*\])')
+# jQuery-style text matching that Selenium's CSS engine doesn't support
+_NOT_CONTAINS_RE = re.compile(r":not\(:contains\((['\"])(.*?)\1\)\)")
+_CONTAINS_RE = re.compile(r":contains\((['\"])(.*?)\1\)|\[contains\(text\(\),\s*(['\"])(.*?)\3\)\]")
+
+# Button text that indicates a coupon has already been clipped
+_CLIPPED_TERMS = ("clipped", "added", "saved", "in cart", "remove")
+
+# Checks the clipped state of each element in arguments[0] given the site's clipped
+# indicators (arguments[1]), clipped button text (arguments[2]) and the site's :contains()
+# indicators as [css, lowercase text] pairs (arguments[3]): "Unclip" or clipped text, a
+# clipped indicator class or selector match, a text indicator match, or a disabled button
+_CLIPPED_STATUS_JS = """
+    const selectors = arguments[1], terms = arguments[2], textSelectors = arguments[3];
+    const matches = (el, s) => {
+        try { return el.matches(s); } catch (e) { return false; }
+    };
+    return arguments[0].map(el => {
+        try {
+            const text = (el.innerText || '').toLowerCase();
+            if (text.includes('unclip') || terms.some(t => text.includes(t))) return true;
+            const cls = el.getAttribute('class') || '';
+            if (selectors.some(s => cls.includes(s) || matches(el, s))) return true;
+            if (textSelectors.some(([css, t]) => text.includes(t) && matches(el, css))) return true;
+            return el.hasAttribute('disabled') || el.getAttribute('aria-disabled') === 'true';
+        } catch (e) {
+            return false;
+        }
+    });
+"""
+
+# Installed on every page: remembers the Retry-After header of the last 429/503 response
+# to the page's own fetch/XHR requests, for _read_retry_after. Safe to run twice on a page
+_RETRY_AFTER_HOOK_JS = """
+    (() => {
+        if (window.__couponClipperHooked) return;
+        window.__couponClipperHooked = true;
+        const note = (status, value) => {
+            if ((status === 429 || status === 503) && value) window.__couponClipperRetryAfter = value;
+        };
+        const originalFetch = window.fetch;
+        if (originalFetch) {
+            window.fetch = function() {
+                return originalFetch.apply(this, arguments).then(response => {
+                    note(response.status, response.headers.get('retry-after'));
+                    return response;
+                });
+            };
+        }
+        const originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function() {
+            this.addEventListener('loadend', () => {
+                try { note(this.status, this.getResponseHeader('retry-after')); } catch (e) {}
+            });
+            return originalSend.apply(this, arguments);
+        };
+    })();
+"""
+
+# Looks for rate limit phrases in the visible text of the first visible element matching
+# arguments[0] (or the body): site indicators (arguments[1]) first, then generic phrases
+# (arguments[2]). The text is split into words once, so phrases only match whole words
+# across any spacing or line breaks. Only the first 8 KB of text is searched, since
+# rate limit messages show at the top. Both lists must be in _word_phrase form, which
+# needs no escaping to be joined into a single RegExp per list.
+# Returns {indicator} or {phrase}, or null
+_RATE_LIMIT_CHECK_JS = """
+    let root = null;
+    for (const el of document.querySelectorAll(arguments[0])) {
+        const rect = el.getBoundingClientRect();
+        if (rect.width && rect.height) { root = el; break; }
+    }
+    root = root || document.body;
+    const text = root ? (root.innerText || '').slice(0, 8192).toLowerCase() : '';
+    const words = ' ' + text.split(/[^a-z0-9]+/).join(' ') + ' ';
+    const search = list => {
+        if (!list.length) return null;
+        const match = words.match(new RegExp(list.join('|')));
+        return match ? match[0].trim() : null;
+    };
+    const indicator = search(arguments[1]);
+    if (indicator) return {indicator: indicator};
+    const phrase = search(arguments[2]);
+    return phrase ? {phrase: phrase} : null;
+"""
+
+def _word_phrase(phrase):
+    """
+    Normalize a phrase for whole-word matching by _RATE_LIMIT_CHECK_JS.
+    
+    Args:
+        phrase (str): Plain-text phrase
+        
+    Returns:
+        str: The phrase's lowercase words, space-separated and space-padded, or None if it has no words
+    """
+    words = re.findall(r"[a-z0-9]+", phrase.lower())
+    return f" {' '.join(words)} " if words else None
+
+def _xpath_literal(text):
+    """
+    Quote text as an XPath string literal, even if it contains quotes.
+    
+    Args:
+        text (str): The text to quote
+        
+    Returns:
+        str: XPath expression evaluating to the text
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    # XPath 1.0 has no escapes, so build it from single-quoted pieces
+    return "concat({})".format(", \"'\", ".join(f"'{part}'" for part in text.split("'")))
+
+_XPATH_LOWER = "translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+@functools.lru_cache(maxsize=None)
+def _text_button_xpath(button_text, exclude_text=None):
+    """
+    Build the XPaths matching elements by their text.
+    
+    Exact (case-sensitive) matches are preferred; the case-insensitive partial
+    XPath is meant to be tried only when the exact one finds nothing (see
+    _XPATH_FALLBACK_JS).
+    
+    Args:
+        button_text (str): The text to look for
+        exclude_text (str): Lowercase text that disqualifies a match
+        
+    Returns:
+        tuple: The exact and partial XPath expressions
+    """
+    exact = f"//*[text()={_xpath_literal(button_text)}]"
+    partial = f"contains({_XPATH_LOWER}, {_xpath_literal(button_text.lower())})"
+    if exclude_text:
+        partial += f" and not(contains({_XPATH_LOWER}, {_xpath_literal(exclude_text)}))"
+    return exact, f"//*[{partial}]"
+
+# Returns the matches of the first XPath argument that finds anything
+_XPATH_FALLBACK_JS = """
+    for (const xpath of arguments) {
+        const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        if (!result.snapshotLength) continue;
+        const out = [];
+        for (let i = 0; i < result.snapshotLength; i++) out.push(result.snapshotItem(i));
+        return out;
+    }
+    return [];
+"""
+
+# Common coupon button text, matched exactly or as part of an element's text
+_COUPON_BUTTON_TEXTS = ("clip coupon", "CLIP COUPON", "clip", "add coupon", "add offer")
+_COUPON_TEXT_XPATH = "//*[{}]".format(" or ".join(
+    f"text()='{text}' or contains(text(), '{text}')" for text in _COUPON_BUTTON_TEXTS
+))
+
+# Common 'load more' button text, matched case-insensitively in one query
+_LOAD_MORE_TEXTS = ("load more", "show more", "view more", "more coupons", "see more")
+_LOAD_MORE_TEXT_XPATH = "//*[{}]".format(" or ".join(
+    f"contains({_XPATH_LOWER}, '{text}')" for text in _LOAD_MORE_TEXTS
+))
+
+# Common 'load more' id/class patterns, tried last as one query
+_LOAD_MORE_ATTRIBUTE_CSS = ", ".join((
+    "[id*='load-more']",
+    "[id*='loadMore']",
+    "[class*='load-more']",
+    "[class*='loadMore']"
+))
+
+# Selectors known to work well for Weis coupon buttons
+_WEIS_BUTTON_SELECTORS = (
+    ".btn-clip:not(.added)",
+    ".coupon-add",
+    ".add-coupon",
+    "button[data-coupon-id]",
+    "button.coupon__btn",
+    "button.add"
+)
+
+# Elements shown while a CloudFlare browser check is running
+_CLOUDFLARE_INDICATORS = (
+    "#challenge-running",
+    "#challenge-form",
+    ".cf-browser-verification",
+    "#cf-please-wait",
+    "#cf-content"
+)
+
+# Common CAPTCHA UI elements, checked after any site-specific indicators
+_CAPTCHA_UI_SELECTORS = (
+    ".g-recaptcha",
+    "#captcha",
+    "[name='captcha']",
+    "[id*='captcha']",
+    "[class*='captcha']",
+    ".recaptcha-checkbox"
+)
+
+# Error text meaning the driver can't run DevTools commands at all, for _cdp_eval
+_CDP_UNSUPPORTED_MARKERS = ("unknown command", "unknown method", "wasn't found", "not supported")
+
+# Defines firstVisibleSelector(selectors) for the CAPTCHA scripts: the first selector
+# matching an element that is rendered and not visibility:hidden, or null
+_FIRST_VISIBLE_SELECTOR_JS = """
+    const firstVisibleSelector = selectors => {
+        for (const sel of selectors) {
+            let els;
+            try { els = document.querySelectorAll(sel); } catch (e) { continue; }
+            for (const el of els) {
+                if (el.getClientRects().length && getComputedStyle(el).visibility !== 'hidden') return sel;
+            }
+        }
+        return null;
+    };
+"""
+
+# Login forms that mean login is required if shown prominently
+_LOGIN_FORM_SELECTORS = (
+    "form[action*='login']",
+    "form[action*='signin']",
+    "form.login-form",
+    "#login-form",
+    ".login-form",
+    "form.signin-form",
+    "#signin-form",
+    ".signin-form"
+)
+
+# Login button/link text that means login is required if shown in the main content,
+# matched case-insensitively
+_LOGIN_BUTTON_TEXTS = ("sign in", "log in")
+
+# Main content areas of a page
+_MAIN_CONTENT_SELECTORS = ("main", "#main", ".main-content", "#content", ".content")
+
+# Where rate limit messages are looked for, as one selector
+_RATE_LIMIT_SCOPE = ", ".join(_MAIN_CONTENT_SELECTORS + ("article",))
+
+# Clear login messaging in main content
+_LOGIN_PHRASES = (
+    "please log in to view coupons",
+    "please sign in to view coupons",
+    "login required to see coupons",
+    "sign in required to see coupons",
+    "log in to clip coupons",
+    "sign in to clip coupons"
+)
+
+# Page text that indicates a CAPTCHA or browser check is showing
+_CAPTCHA_PHRASES = (
+    "complete the captcha",
+    "solve the captcha",
+    "i'm not a robot",
+    "security check",
+    "checking your browser",
+    "please enable javascript",
+    "please wait while we verify",
+    "please wait..."  # CloudFlare indicator
+)
+
+# Generic rate limit phrases - more specific than "please try again later" to avoid false positives
+_RATE_LIMIT_PHRASES = (
+    "rate limit",
+    "too many requests",
+    "too many attempts",
+    "try again later",
+    "temporarily blocked"
+)
+
+_SYSTEM = platform.system()
+
+# Where Chrome is usually installed on each operating system
+_CHROME_PATHS = {
+    "Windows": [
+        os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
+        os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
+        os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\Application\\chrome.exe')
+    ],
+    "Darwin": [  # macOS
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+        os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome')
+    ],
+    "Linux": [
+        '/usr/bin/google-chrome',
+        '/usr/bin/chrome',
+        '/snap/bin/chromium',
+        '/usr/bin/chromium',
+        '/usr/bin/chromium-browser',
+    ]
+}.get(_SYSTEM, [])
+
+# Default Chrome user data directory on each operating system
+_CHROME_PROFILE_DIR = {
+    "Windows": os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\User Data'),
+    "Darwin": os.path.expanduser('~/Library/Application Support/Google/Chrome'),  # macOS
+    "Linux": os.path.expanduser('~/.config/google-chrome')
+}.get(_SYSTEM)
+
+# Chrome lookups only depend on the machine, so they are cached for the whole run
+# (they are repeated on every driver setup and reconnection)
+@functools.lru_cache(maxsize=None)
+def _find_chrome_path():
+    """
+    Find the Chrome executable path on different operating systems.
+    
+    Returns:
+        str: Path to Chrome executable or None if not found
+    """
+    path = next((p for p in _CHROME_PATHS if os.path.exists(p)), None)
+    if path:
+        logger.info("Found Chrome at: %s", path)
+    else:
+        logger.warning("Could not find Chrome automatically.")
+    return path
+
+def _get_chrome_default_profile():
+    """
+    Get the path to the default Chrome user data directory.
+    
+    Returns:
+        str: Path to Chrome user data directory
+    """
+    return _CHROME_PROFILE_DIR
+
+@functools.lru_cache(maxsize=None)
+def _get_chrome_profiles(user_data_dir):
+    """
+    Get the available Chrome profiles.
+    
+    Args:
+        user_data_dir (str): Path to Chrome user data directory
+        
+    Returns:
+        tuple: Profile names
+    """
+    profiles = ["Default"]
+    
+    if not os.path.exists(user_data_dir):
+        return tuple(profiles)
+    
+    # Look for Profile* directories
+    with os.scandir(user_data_dir) as entries:
+        profiles.extend(
+            entry.name for entry in entries
+            if entry.name.startswith("Profile ") and entry.is_dir(follow_symlinks=False)
+        )
+    
+    return tuple(profiles)
+
+def _debug_port_open(port, host="127.0.0.1", timeout=0.2):
+    """
+    Check whether something is accepting connections on the Chrome debugging port.
+    
+    Args:
+        port (int): Debugging port to probe
+        host (str): Host to connect to
+        timeout (float): Connection timeout in seconds
+        
+    Returns:
+        bool: True if the port accepted a connection, False otherwise
+    """
+    try:
+        socket.create_connection((host, port), timeout).close()
+        return True
+    except OSError:
+        return False
+
+def _wait_for_port(port, host="127.0.0.1", timeout=5.0, interval=0.05):
+    """
+    Wait until the Chrome debugging port accepts connections.
+    
+    Args:
+        port (int): Debugging port to wait for
+        host (str): Host to connect to
+        timeout (float): Maximum number of seconds to wait
+        interval (float): Pause between connection attempts in seconds
+        
+    Returns:
+        bool: True if the port opened before the timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _debug_port_open(port, host, timeout=interval):
+            return True
+        time.sleep(interval)
+    return False
+
+def _timed_input(prompt, timeout):
+    """
+    Read a line from the user, giving up after a timeout.
+    
+    Windows consoles can't be polled with select(), so there the wait has no timeout.
+    
+    Args:
+        prompt (str): Prompt to show
+        timeout (float): Seconds to wait for an answer
+        
+    Returns:
+        str: The line entered, or None if there was no answer in time
+    """
+    if _SYSTEM == "Windows" or not sys.stdin.isatty():
+        return input(prompt)
+        
+    print(prompt, end="", flush=True)
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        print()
+        return None
+    return sys.stdin.readline().rstrip("\n")
+
+def _install_retry_after_hook(driver, current_page=False):
+    """
+    Install _RETRY_AFTER_HOOK_JS for every page the driver's current tab loads from now on.
+    
+    DevTools scripts only apply to the tab they were registered on, so each tab
+    needs its own call.
+    
+    Args:
+        driver: The WebDriver, switched to the tab to hook
+        current_page (bool): Also hook the page that is already loaded
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _RETRY_AFTER_HOOK_JS})
+        if current_page:
+            driver.execute_cdp_cmd("Runtime.evaluate", {"expression": _RETRY_AFTER_HOOK_JS})
+    except (AttributeError, WebDriverException) as e:
+        logger.debug("Could not install Retry-After hook: %s", e)
+
+class _PersistentService(Service):
+    """
+    A chromedriver service that survives driver.quit() so reconnects can reuse it.
+    
+    The chromedriver process is only started once and is stopped explicitly with shutdown().
+    """
+    
+    def start(self):
+        """Start chromedriver unless it is already running."""
+        process = getattr(self, "process", None)
+        if process is None or process.poll() is not None:
+            super().start()
+            
+    def stop(self):
+        """Keep chromedriver running when a driver using it quits."""
+        
+    def shutdown(self):
+        """Stop the chromedriver process."""
+        super().stop()
+
 class CouponClipper:
     """
     A class for automatically clipping coupons on grocery websites.
     """
     
+    __slots__ = (
+        "config", "_use_default_profile", "driver", "backoff_time", "consecutive_success",
+        "rate_limit_hit", "rate_limit_times", "_delay_scale", "driver_options", "current_website_key",
+        "connection_attempt_count", "_service", "_site_prefs", "_tabs", "_find_memo",
+        "_cdp_available",
+    )
+    
     def __init__(self, config_file="coupon_config.json", attach_to_existing=True):
         """
         Initialize the CouponClipper with configuration and browser setup.
@@ -56,19 +535,115 @@ class CouponClipper:
         self.backoff_time = 1  # Initial backoff time in seconds
         self.consecutive_success = 0  # Track consecutive successful clips
         self.rate_limit_hit = False
-        self.rate_limit_count = 0  # Count consecutive rate limit detections
+        self.rate_limit_times = deque()  # When generic rate limit phrases were seen recently
+        self._delay_scale = 1.0  # Click delay multiplier, doubled on rate limits and eased back after clean clips
         self.driver_options = None  # Store driver options for reconnection
         self.current_website_key = None  # Track current website for site-specific settings
         self.connection_attempt_count = 0  # Track connection attempts for recovery
+        self._service = None  # Shared chromedriver service, started on first driver setup
+        self._site_prefs = {}  # Per-site choices gathered by prepare()
+        self._tabs = {}  # Window handles of sites preloaded by clip_all()
+        self._find_memo = {}  # Recently found buttons keyed by (website key, page fingerprint)
+        self._cdp_available = True  # Whether the driver supports Chrome DevTools commands
         
     def _load_config(self, config_file):
         """Load configuration from a JSON file."""
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                config = json.loads(f.read())
         except FileNotFoundError:
-            logger.warning(f"Config file {config_file} not found. Using default configuration.")
-            return self._default_config()
+            logger.warning("Config file %s not found. Using default configuration.", config_file)
+            config = self._default_config()
+            
+        return self._compile_website_config(config)
+    
+    def _compile_website_config(self, config):
+        """
+        Pre-parse the selector strings of every website once so lookups don't re-split them.
+        
+        The result is stored under each website's "_compiled" key, together with the
+        flattened site-specific settings. Selectors using
+        jQuery-style :contains() are separated into (css, text) pairs since the browser
+        can't evaluate them as CSS.
+        
+        Args:
+            config (dict): Full configuration dictionary
+            
+        Returns:
+            dict: The same configuration with compiled selectors added
+        """
+        for website_config in config.get("websites", {}).values():
+            clip_css, clip_text = self._split_selectors(website_config.get("coupon_button_selector", ""))
+            clipped_css, clipped_text = self._split_selectors(website_config.get("coupon_clipped_indicator", ""))
+            load_more_css, load_more_text = self._split_selectors(website_config.get("load_more_button_selector", ""))
+            site_captcha = tuple(website_config.get("captcha_indicators", []))
+            rate_limit_indicators = website_config.get("rate_limit_indicators", [])
+            site_settings = website_config.get("site_specific_settings") or {}
+            
+            website_config["_compiled"] = {
+                "clip_selectors": clip_css,
+                "clip_text_selectors": clip_text,
+                "clipped_selectors": clipped_css,
+                "clipped_text_selectors": clipped_text,
+                "load_more_selectors": load_more_css,
+                "load_more_text_selectors": load_more_text,
+                # The CSS selectors joined into one query
+                "clip_css": ", ".join(clip_css),
+                "load_more_css": ", ".join(load_more_css),
+                # Every CAPTCHA element to look for, in the order they're checked
+                "captcha_probe_selectors": (
+                    _CLOUDFLARE_INDICATORS + site_captcha + _CAPTCHA_UI_SELECTORS
+                ),
+                # CAPTCHA elements checked again after refreshing the page
+                "captcha_recheck_selectors": _CAPTCHA_UI_SELECTORS + site_captcha,
+                # Arguments for _CLIPPED_STATUS_JS, as lists ready to pass to the browser
+                "clipped_script_args": (
+                    list(clipped_css), list(_CLIPPED_TERMS),
+                    [[css, text.lower()] for css, text in clipped_text]
+                ),
+                # Arguments for _RATE_LIMIT_CHECK_JS after the scope: site indicators and
+                # generic phrases, normalized once here and ready to pass to the browser
+                "rate_limit_script_args": (
+                    [w for w in map(_word_phrase, rate_limit_indicators) if w],
+                    [w for w in map(_word_phrase, _RATE_LIMIT_PHRASES) if w]
+                ),
+                "rapid_mode_compatible": bool(site_settings.get("rapid_mode_compatible", False)),
+                "min_delay_override": site_settings.get("min_delay_override"),
+                "max_delay_override": site_settings.get("max_delay_override")
+            }
+            
+        return config
+    
+    def _split_selectors(self, selector_string):
+        """
+        Split a comma-separated selector string into CSS selectors and text matches.
+        
+        Args:
+            selector_string (str): Selector list as written in the config
+            
+        Returns:
+            tuple: (tuple of CSS selectors, tuple of (css, text) pairs for :contains() selectors)
+        """
+        css_selectors = []
+        text_selectors = []
+        
+        for selector in _SELECTOR_SPLIT_RE.split(selector_string or ""):
+            selector = selector.strip()
+            if not selector:
+                continue
+                
+            # Negated text matches can't be expressed in CSS; clipped state is checked separately
+            selector = _NOT_CONTAINS_RE.sub("", selector)
+            
+            match = _CONTAINS_RE.search(selector)
+            if match:
+                text = match.group(2) if match.group(2) is not None else match.group(4)
+                css = _CONTAINS_RE.sub("", selector).strip() or "*"
+                text_selectors.append((css, text))
+            else:
+                css_selectors.append(selector)
+                
+        return tuple(css_selectors), tuple(text_selectors)
             
     def _default_config(self):
         """Return a default configuration if no file is found."""
@@ -220,7 +795,8 @@ class CouponClipper:
                 "acceleration_threshold": 3,
                 "adaptive_delay": True,
                 "enable_rate_limit_detection": True,  # Can be turned off
-                "rate_limit_threshold": 3,  # Number of consecutive detections before considering it a true rate limit
+                "rate_limit_threshold": 3,  # Number of detections within the window before considering it a true rate limit
+                "rate_limit_window": 60,  # Seconds that a detection counts towards the threshold
                 "rate_limit_check_main_content_only": True,  # Only check main content for rate limit messages
                 "rate_limit_backoff_factor": 1.5,  # Less aggressive backoff factor (previously 2)
                 "fast_scroll": True,  # Enable faster scrolling
@@ -228,7 +804,8 @@ class CouponClipper:
                 "max_recovery_attempts": 3,  # Maximum attempts to recover driver connection
                 "connection_check_interval": 5,  # Check driver connection every N coupons
                 "rapid_mode_min_delay": 0.05,  # Extra fast delays for rapid mode
-                "rapid_mode_max_delay": 0.2
+                "rapid_mode_max_delay": 0.2,
+                "rapid_mode_batch_size": 20  # Coupons clicked per browser call in rapid mode
             }
         }
             
@@ -239,36 +816,7 @@ class CouponClipper:
         Returns:
             str: Path to Chrome executable or None if not found
         """
-        system = platform.system()
-        possible_paths = []
-        
-        if system == "Windows":
-            possible_paths = [
-                os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\Application\\chrome.exe')
-            ]
-        elif system == "Darwin":  # macOS
-            possible_paths = [
-                '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-                os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome')
-            ]
-        elif system == "Linux":
-            possible_paths = [
-                '/usr/bin/google-chrome',
-                '/usr/bin/chrome',
-                '/snap/bin/chromium',
-                '/usr/bin/chromium',
-                '/usr/bin/chromium-browser',
-            ]
-            
-        for path in possible_paths:
-            if os.path.exists(path):
-                logger.info(f"Found Chrome at: {path}")
-                return path
-                
-        logger.warning("Could not find Chrome automatically.")
-        return None
+        return _find_chrome_path()
         
     def _get_chrome_default_profile(self):
         """
@@ -277,16 +825,7 @@ class CouponClipper:
         Returns:
             str: Path to Chrome user data directory
         """
-        system = platform.system()
-        
-        if system == "Windows":
-            return os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\User Data')
-        elif system == "Darwin":  # macOS
-            return os.path.expanduser('~/Library/Application Support/Google/Chrome')
-        elif system == "Linux":
-            return os.path.expanduser('~/.config/google-chrome')
-        
-        return None
+        return _get_chrome_default_profile()
         
     def _get_chrome_profiles(self, user_data_dir):
         """
@@ -298,17 +837,7 @@ class CouponClipper:
         Returns:
             list: List of profile names
         """
-        profiles = ["Default"]
-        
-        if not os.path.exists(user_data_dir):
-            return profiles
-            
-        # Look for Profile* directories
-        for item in os.listdir(user_data_dir):
-            if item.startswith("Profile "):
-                profiles.append(item)
-                
-        return profiles
+        return list(_get_chrome_profiles(user_data_dir))
     
     def _launch_chrome_with_debugging(self, port=9222, use_default_profile=True):
         """
@@ -327,7 +856,7 @@ class CouponClipper:
             return False
             
         try:
-            logger.info(f"Launching Chrome with remote debugging on port {port}")
+            logger.info("Launching Chrome with remote debugging on port %s", port)
             
             # Determine which profile to use
             user_data_dir = None
@@ -336,7 +865,7 @@ class CouponClipper:
             if use_default_profile:
                 user_data_dir = self._get_chrome_default_profile()
                 if user_data_dir and os.path.exists(user_data_dir):
-                    logger.info(f"Using default Chrome profile at: {user_data_dir}")
+                    logger.info("Using default Chrome profile at: %s", user_data_dir)
                     
                     # Get available profiles
                     profiles = self._get_chrome_profiles(user_data_dir)
@@ -357,7 +886,7 @@ class CouponClipper:
                     else:
                         profile_dir = "Default"
                     
-                    logger.info(f"Using Chrome profile: {profile_dir}")
+                    logger.info("Using Chrome profile: %s", profile_dir)
                 else:
                     logger.warning("Could not find default Chrome profile directory")
                     user_data_dir = os.path.join(os.path.expanduser("~"), "ChromeDebugProfile")
@@ -382,27 +911,23 @@ class CouponClipper:
                 "--no-default-browser-check"
             ])
             
-            # Check if Chrome is already running with this profile
-            chrome_running = False
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                if proc.info['name'] and 'chrome' in proc.info['name'].lower():
-                    cmd_line = proc.info['cmdline']
-                    if cmd_line and user_data_dir in ' '.join(cmd_line):
-                        logger.warning("Chrome is already running with this profile")
-                        chrome_running = True
-                        break
+            # Check if Chrome is already running with remote debugging enabled
+            chrome_running = _debug_port_open(port)
+            if chrome_running:
+                logger.warning("Chrome is already listening for remote debugging on port %s", port)
             
             if not chrome_running:
                 # Use Popen to avoid blocking
-                process = subprocess.Popen(cmd)
+                subprocess.Popen(cmd)
                 
-                # Wait a bit for Chrome to start
-                time.sleep(3)
+                # Wait for Chrome to start accepting debugger connections
+                if not _wait_for_port(port):
+                    logger.warning("Chrome did not open debugging port %s in time", port)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error launching Chrome: {e}")
+            logger.error("Error launching Chrome: %s", e)
             return False
             
     def setup_driver(self, attach_to_existing=True):
@@ -436,63 +961,127 @@ class CouponClipper:
         self.driver_options = options
             
         try:
-            self.driver = webdriver.Chrome(options=options)
+            self.driver = self._create_driver(options)
             self.connection_attempt_count = 0  # Reset connection attempts on successful connection
             return self.driver
         except Exception as e:
-            logger.error(f"Failed to initialize WebDriver: {e}")
+            logger.error("Failed to initialize WebDriver: %s", e)
             raise
     
-    def check_driver_connection(self):
+    def _create_driver(self, options):
+        """
+        Create a Chrome WebDriver, reusing the same chromedriver process across reconnects.
+        
+        Args:
+            options (Options): Chrome options for the new session
+            
+        Returns:
+            webdriver.Chrome: New Chrome WebDriver instance
+        """
+        if self._service is None:
+            self._service = _PersistentService()
+            
+        # Tabs and found buttons belong to the previous session
+        self._tabs = {}
+        self._find_memo = {}
+        self._cdp_available = True
+            
+        # Reuse one HTTP connection to chromedriver for every command. A single connection
+        # is all a single-threaded client needs, so the pool size stays at its default
+        driver = webdriver.Chrome(service=self._service, options=options, keep_alive=True)
+        _install_retry_after_hook(driver)
+        return driver
+    
+    def check_driver_connection(self, restore_page=True):
         """
         Check if the WebDriver connection is still valid and try to reconnect if not.
         
+        Args:
+            restore_page (bool): Whether to reload the current website after reconnecting
+            
         Returns:
             bool: True if connection is valid or reconnection successful, False otherwise
         """
         if not self.driver:
             return False
             
+        if self._driver_alive():
+            return True
+            
+        # Try to reconnect
+        if self.connection_attempt_count < self.config["settings"].get("max_recovery_attempts", 3):
+            self.connection_attempt_count += 1
+            logger.info("Attempting to reconnect (attempt %s)...", self.connection_attempt_count)
+            
+            try:
+                # Close the broken driver if possible
+                try:
+                    self.driver.quit()
+                except:
+                    pass
+                
+                # Reset the driver
+                self.driver = None
+                
+                # Recreate the driver
+                time.sleep(2)  # Brief pause before reconnecting
+                self.driver = self._create_driver(self.driver_options)
+                
+                # Try to navigate back to the current website
+                if restore_page and self.current_website_key:
+                    website_config = self.config["websites"][self.current_website_key]
+                    self.driver.get(website_config['url'])
+                    time.sleep(3)  # Wait for page to load
+                
+                logger.info("Successfully reconnected to browser")
+                return True
+            except Exception as e:
+                logger.error("Failed to reconnect to browser: %s", e)
+                return False
+        else:
+            logger.error("Exceeded maximum reconnection attempts (%s)", self.connection_attempt_count)
+            return False
+    
+    def _driver_alive(self):
+        """
+        Check whether the browser session still responds, without trying to reconnect.
+        
+        Returns:
+            bool: True if the session responded, False otherwise
+        """
+        if not self.driver:
+            return False
+            
+        # A chromedriver process that has exited can't answer, so don't send it a command
+        process = getattr(self._service, "process", None)
+        if process is not None and process.poll() is not None:
+            logger.warning("chromedriver is no longer running")
+            return False
+            
         try:
             # Try a simple operation to check connection
             _ = self.driver.current_url
             return True
         except Exception as e:
-            logger.warning(f"Driver connection check failed: {e}")
+            logger.warning("Driver connection check failed: %s", e)
+            return False
+    
+    def _try_reconnect(self, max_attempts=3):
+        """
+        Check the driver connection, backing off exponentially between failed attempts.
+        
+        Args:
+            max_attempts (int): Maximum number of connection checks
             
-            # Try to reconnect
-            if self.connection_attempt_count < self.config["settings"].get("max_recovery_attempts", 3):
-                self.connection_attempt_count += 1
-                logger.info(f"Attempting to reconnect (attempt {self.connection_attempt_count})...")
-                
-                try:
-                    # Close the broken driver if possible
-                    try:
-                        self.driver.quit()
-                    except:
-                        pass
-                    
-                    # Reset the driver
-                    self.driver = None
-                    
-                    # Recreate the driver
-                    time.sleep(2)  # Brief pause before reconnecting
-                    self.driver = webdriver.Chrome(options=self.driver_options)
-                    
-                    # Try to navigate back to the current website
-                    if self.current_website_key:
-                        website_config = self.config["websites"][self.current_website_key]
-                        self.driver.get(website_config['url'])
-                        time.sleep(3)  # Wait for page to load
-                    
-                    logger.info("Successfully reconnected to browser")
-                    return True
-                except Exception as e:
-                    logger.error(f"Failed to reconnect to browser: {e}")
-                    return False
-            else:
-                logger.error(f"Exceeded maximum reconnection attempts ({self.connection_attempt_count})")
-                return False
+        Returns:
+            bool: True if the connection is valid or was restored, False otherwise
+        """
+        for attempt in range(max_attempts):
+            if attempt:
+                time.sleep((2 ** attempt) * 0.25 + random.random() * 0.1)
+            if self.check_driver_connection():
+                return True
+        return False
     
     def clip_coupons(self, website_key):
         """
@@ -503,10 +1092,11 @@ class CouponClipper:
             website_key (str): Key for the website configuration in the config file
             
         Returns:
-            bool: True if completed successfully, False if terminated early
+            bool: True to carry on with other websites, False if the user asked to stop
+            and return to website selection
         """
         if website_key not in self.config["websites"]:
-            logger.error(f"Website '{website_key}' not found in configuration")
+            logger.error("Website '%s' not found in configuration", website_key)
             return True  # Return True to continue with other websites
             
         # Store current website key for potential reconnection
@@ -519,70 +1109,63 @@ class CouponClipper:
         self.backoff_time = 1
         self.consecutive_success = 0
         self.rate_limit_hit = False
-        self.rate_limit_count = 0
+        self.rate_limit_times.clear()
+        self._delay_scale = 1.0
         self.connection_attempt_count = 0
         
-        # Apply site-specific settings if available
-        site_settings = website_config.get("site_specific_settings", {})
-        if site_settings:
-            # Override delay settings if specified for this site
-            if site_settings.get("min_delay_override") is not None:
-                logger.info(f"Using site-specific min delay: {site_settings.get('min_delay_override')}")
-                settings["site_min_delay"] = site_settings.get("min_delay_override")
-            else:
-                settings["site_min_delay"] = None
-                
-            if site_settings.get("max_delay_override") is not None:
-                logger.info(f"Using site-specific max delay: {site_settings.get('max_delay_override')}")
-                settings["site_max_delay"] = site_settings.get("max_delay_override")
-            else:
-                settings["site_max_delay"] = None
-                
-            # Check if site supports rapid mode
-            settings["site_rapid_compatible"] = site_settings.get("rapid_mode_compatible", False)
-            if settings["site_rapid_compatible"]:
-                logger.info(f"{website_key} supports rapid mode for faster clipping")
-        
-        # Ask user if they want to enable rate limit detection for this site
-        if website_key == "weis":
-            print("\nWeis Markets may have issues with automatic rate limit detection.")
-            print("1. Enable automatic rate limit detection (default)")
-            print("2. Disable automatic rate limit detection")
-            print("3. Manual mode - ask before applying rate limits")
-            
-            try:
-                rate_limit_choice = input("\nSelect option (1-3, default: 1): ") or "1"
-                
-                if rate_limit_choice == "2":
-                    settings["enable_rate_limit_detection"] = False
-                    print("Automatic rate limit detection disabled.")
-                elif rate_limit_choice == "3":
-                    settings["manual_rate_limit_confirmation"] = True
-                    print("Manual rate limit confirmation enabled.")
-                else:
-                    settings["enable_rate_limit_detection"] = True
-                    settings["manual_rate_limit_confirmation"] = False
-                    print("Automatic rate limit detection enabled.")
-            except ValueError:
-                # Default to enabling rate limit detection
-                settings["enable_rate_limit_detection"] = True
-                settings["manual_rate_limit_confirmation"] = False
+        # Clipping progress, also reported if the user interrupts before clipping starts
+        clipped_count = 0
+        already_clipped_count = 0
+        total_buttons = 0
+        i = 0
+        
+        # Apply site-specific settings
+        compiled = website_config["_compiled"]
+        
+        # Override delay settings if specified for this site
+        settings["site_min_delay"] = compiled["min_delay_override"]
+        if compiled["min_delay_override"] is not None:
+            logger.info("Using site-specific min delay: %s", compiled['min_delay_override'])
+            
+        settings["site_max_delay"] = compiled["max_delay_override"]
+        if compiled["max_delay_override"] is not None:
+            logger.info("Using site-specific max delay: %s", compiled['max_delay_override'])
+            
+        # Check if site supports rapid mode
+        settings["site_rapid_compatible"] = compiled["rapid_mode_compatible"]
+        if settings["site_rapid_compatible"]:
+            logger.info("%s supports rapid mode for faster clipping", website_key)
+        
+        # Apply choices gathered by prepare(), or ask for them now
+        site_prefs = self._site_prefs.pop(website_key, None)
+        if site_prefs is not None:
+            settings.update(site_prefs)
+        else:
+            settings.update(self._ask_rate_limit_preference(website_key))
         
-        # Set up the driver if not already done
+        # Set up the driver if not already done. A successful reconnect needs no further
+        # setup, and the page isn't restored since we navigate to the site below anyway
         if not self.driver:
             self.setup_driver()
-        elif not self.check_driver_connection():
-            # If driver connection check fails, try to set up a new driver
+        elif not self.check_driver_connection(restore_page=False):
+            # If reconnecting failed too, try to set up a new driver
             logger.warning("Driver connection invalid, setting up new driver")
             self.setup_driver()
         
         try:
-            # Navigate to the website
-            logger.info(f"Navigating to {website_config['url']}")
-            self.driver.get(website_config['url'])
+            # Switch to the tab preloaded by clip_all, or navigate to the website
+            tab = self._tabs.pop(website_key, None)
+            if tab and tab in self.driver.window_handles:
+                logger.info("Switching to preloaded tab for %s", website_key)
+                self.driver.switch_to.window(tab)
+                # Tabs opened by clip_all are new DevTools targets without the hook
+                _install_retry_after_hook(self.driver, current_page=True)
+            else:
+                logger.info("Navigating to %s", website_config['url'])
+                self.driver.get(website_config['url'])
             
             # Wait for the page to load
-            time.sleep(settings.get("random_delay_max", 3))
+            self._wait_for_coupon_page(website_config, settings)
             
             # Check for Cloudflare or other CAPTCHA
             if self._check_for_captcha(website_config):
@@ -596,8 +1179,8 @@ class CouponClipper:
                 input("Press Enter after you've logged in to continue...")
                 logger.info("User indicated login is complete, continuing")
                 
-                # Wait a bit more after login
-                time.sleep(3)
+                # Wait for the coupon page to be ready after login
+                self._wait_for_coupon_page(website_config, settings)
                 
             # Load all content by scrolling and clicking load more
             try:
@@ -606,7 +1189,7 @@ class CouponClipper:
                 # Allow the user to control the process during content loading
                 choice = self._control_menu(0, 0)
                 if choice != 'c':  # If not continue
-                    return False
+                    return choice != 's'  # Stop only on "s" (select new site)
             
             # Try to find coupon buttons
             coupon_buttons = self._find_coupon_buttons_for_website(website_key, website_config)
@@ -619,7 +1202,8 @@ class CouponClipper:
                     return True
             
             total_buttons = len(coupon_buttons)
-            logger.info(f"Found {total_buttons} potential coupons to clip")
+            buttons_fingerprint = self._page_fingerprint()
+            logger.info("Found %s potential coupons to clip", total_buttons)
             
             # Show instructions for control
             print(f"\nFound {total_buttons} potential coupons to clip.")
@@ -627,52 +1211,95 @@ class CouponClipper:
             print("Press Ctrl+C at any time to pause/control the process")
             
             # Ask for clip speed preference with site-specific options
-            self._ask_clip_speed_preference(settings, website_key)
+            if site_prefs is None:
+                settings.update(self._ask_clip_speed_preference(website_key))
+            
+            # Settings that stay fixed while clipping this site
+            rapid_mode = settings.get("enable_rapid_mode", False) and settings.get("site_rapid_compatible", False)
             
             # Clip coupons with adaptive delay and handling page changes
-            clipped_count = 0
-            already_clipped_count = 0
-            i = 0
             buttons_updated = False
             
-            # Pre-check all buttons for already clipped state to improve efficiency
-            already_clipped_map = {}
-            if settings.get("enable_rapid_mode", False) and settings.get("site_rapid_compatible", False):
-                logger.info("Rapid mode enabled - pre-checking clipped status")
-                for idx, button in enumerate(coupon_buttons):
-                    try:
-                        already_clipped_map[idx] = self._is_already_clipped(button, website_config)
-                    except Exception:
-                        # If we can't determine, assume not clipped
-                        already_clipped_map[idx] = False
-                
-                already_clipped_count = sum(1 for clipped in already_clipped_map.values() if clipped)
-                logger.info(f"Pre-check found {already_clipped_count} already clipped coupons")
+            # Pre-check all buttons for already clipped state in one round-trip
+            already_clipped_map = self._bulk_clipped_status(coupon_buttons, website_config)
+            logger.info("Pre-check found %s already clipped coupons", sum(already_clipped_map.values()))
             
             # Calculate initial delay based on settings and site-specific overrides
-            min_delay = settings.get("site_min_delay") if settings.get("site_min_delay") is not None else settings.get("random_delay_min", 0.5)
-            max_delay = settings.get("site_max_delay") if settings.get("site_max_delay") is not None else settings.get("random_delay_max", 1.5)
+            site_min_delay = settings.get("site_min_delay")
+            site_max_delay = settings.get("site_max_delay")
+            min_delay = site_min_delay if site_min_delay is not None else settings.get("random_delay_min", 0.5)
+            max_delay = site_max_delay if site_max_delay is not None else settings.get("random_delay_max", 1.5)
             
             # Apply rapid mode settings if enabled
-            if settings.get("enable_rapid_mode", False) and settings.get("site_rapid_compatible", False):
+            if rapid_mode:
                 min_delay = settings.get("rapid_mode_min_delay", 0.05)
                 max_delay = settings.get("rapid_mode_max_delay", 0.2)
-                logger.info(f"Rapid mode active - using faster delays: {min_delay}-{max_delay}s")
+                logger.info("Rapid mode active - using faster delays: %s-%ss", min_delay, max_delay)
+                
+                # Click every unclipped button from inside the page in one call,
+                # falling back to the per-button loop below if that fails or if
+                # some buttons' clipped state is unknown
+                if not settings.get("force_rate_limit_checks", False) and len(already_clipped_map) == total_buttons:
+                    unclipped_buttons = [
+                        button for idx, button in enumerate(coupon_buttons)
+                        if not already_clipped_map.get(idx, False)
+                    ]
+                    rapid_clipped = self._rapid_clip_all(
+                        unclipped_buttons, min_delay, max_delay,
+                        batch_size=settings.get("rapid_mode_batch_size", 20)
+                    )
+                    if rapid_clipped is not None:
+                        clipped_count = rapid_clipped
+                        logger.info("Finished clipping coupons for %s. Clipped %s coupons.", website_key, clipped_count)
+                        return True
             
             connection_check_counter = 0
             connection_check_interval = settings.get("connection_check_interval", 5)
             
-            while i < len(coupon_buttons):
+            # Settings read inside the loop don't change while clipping this site
+            enable_rapid = settings.get("enable_rapid_mode", False)
+            slow_start = settings.get("slow_start", True) and not enable_rapid
+            acc_threshold = settings.get("acceleration_threshold", 3)
+            check_rate_limits = (not enable_rapid) or settings.get("force_rate_limit_checks", False)
+            enable_rld = settings.get("enable_rate_limit_detection", True)
+            manual_rl = settings.get("manual_rate_limit_confirmation", False)
+            captcha_check = not enable_rapid
+            
+            # After a run of clean rate limit checks, check less often: every 2nd clip
+            # after 20 clean checks, every 4th after 40, and at most every 8th
+            rl_clean_streak = 0
+            rl_next_check = 0
+            
+            # Delay ranges for each slow start state
+            delay_table = {
+                "slow": (min_delay * 1.5, max_delay * 1.5),
+                "cautious": (min_delay * 1.2, max_delay * 1.2),
+                "normal": (min_delay, max_delay),
+            }
+            lognormal = random.lognormvariate
+            sleep = time.sleep
+            
+            # Use the appropriate clicking strategy based on the website
+            click_button = self._enhanced_click_button if website_key in {"weis", "harris_teeter"} else self._click_button
+            is_already_clipped = self._is_already_clipped
+            is_rate_limited = self._is_rate_limited
+            handle_rate_limit = self._handle_rate_limit
+            check_for_captcha = self._check_for_captcha
+            
+            while i < total_buttons:
                 try:
                     # Check connection periodically to ensure it's still valid
                     connection_check_counter += 1
                     if connection_check_counter >= connection_check_interval:
                         connection_check_counter = 0
-                        if not self.check_driver_connection():
-                            logger.warning("Lost connection to driver - attempting recovery")
+                        # A single gate: checks the connection, reconnecting with backoff if it's lost
+                        driver_before = self.driver
+                        connected = self._try_reconnect()
+                        if not connected or self.driver is not driver_before:
+                            logger.warning("Lost connection to driver")
                             
                             # If reconnection failed, ask user what to do
-                            if not self.check_driver_connection():
+                            if not connected:
                                 print("\n" + "="*50)
                                 print("ERROR: Lost connection to browser and couldn't reconnect.")
                                 print("1. Try again")
@@ -689,7 +1316,7 @@ class CouponClipper:
                                         exit(0)  # Exit program
                                     else:
                                         # Try one more time
-                                        if not self.check_driver_connection():
+                                        if not self._try_reconnect():
                                             print("Reconnection failed. Skipping to next website.")
                                             return True
                                 except Exception:
@@ -702,33 +1329,51 @@ class CouponClipper:
                                 print("Could not find coupon buttons after reconnection. Skipping website.")
                                 return True
                             
+                            total_buttons = len(coupon_buttons)
+                            buttons_fingerprint = None
+                            already_clipped_map = self._bulk_clipped_status(coupon_buttons, website_config)
                             i = 0  # Reset counter
                             already_clipped_count = 0
                             clipped_count = 0
+                            rl_clean_streak = 0
+                            rl_next_check = 0
                             buttons_updated = False
                             continue
                     
                     # Each time we try to access a button, first check if we need to refresh our button list
                     if buttons_updated:
                         buttons_updated = False
+                        # If the page looks the same as when we found the buttons and the
+                        # current button is still attached, keep the list we have
+                        if (buttons_fingerprint is not None and i < total_buttons
+                                and self._page_fingerprint() == buttons_fingerprint):
+                            try:
+                                coupon_buttons[i].is_enabled()
+                                logger.info("Page unchanged, keeping current button list")
+                                continue
+                            except StaleElementReferenceException:
+                                pass
+                                
                         # If we detect the page has changed, update our button list
                         try:
                             new_buttons = self._find_coupon_buttons_for_website(website_key, website_config)
                                 
                             if new_buttons:
-                                logger.info(f"Found {len(new_buttons)} buttons after page update")
+                                logger.info("Found %s buttons after page update", len(new_buttons))
                                 coupon_buttons = new_buttons
                                 total_buttons = len(coupon_buttons)
+                                buttons_fingerprint = self._page_fingerprint()
+                                already_clipped_map = self._bulk_clipped_status(coupon_buttons, website_config)
                                 # Reset index to start from beginning with new buttons
                                 i = 0
                                 already_clipped_count = 0
                                 # Continue with the loop
                                 continue
                         except Exception as e:
-                            logger.warning(f"Error updating buttons after page change: {e}")
+                            logger.warning("Error updating buttons after page change: %s", e)
                             
                     # If we've gone through all buttons, we're done
-                    if i >= len(coupon_buttons):
+                    if i >= total_buttons:
                         break
                         
                     button = coupon_buttons[i]
@@ -736,15 +1381,11 @@ class CouponClipper:
                     # Check if button is already clipped before attempting
                     already_clipped = False
                     try:
-                        # If using rapid mode, use our pre-checked map
-                        if settings.get("enable_rapid_mode", False) and settings.get("site_rapid_compatible", False):
-                            if i in already_clipped_map:
-                                already_clipped = already_clipped_map[i]
-                            else:
-                                already_clipped = self._is_already_clipped(button, website_config)
+                        # Use our pre-checked map, checking the button directly if it's missing
+                        if i in already_clipped_map:
+                            already_clipped = already_clipped_map[i]
                         else:
-                            # Standard check for each button
-                            already_clipped = self._is_already_clipped(button, website_config)
+                            already_clipped = is_already_clipped(button, website_config)
                         
                         if already_clipped:
                             already_clipped_count += 1
@@ -755,74 +1396,82 @@ class CouponClipper:
                         logger.info("Detected stale element, refreshing button list")
                         buttons_updated = True
                         continue
+                    except WebDriverException as e:
+                        # The driver may be gone, so check the connection on the next pass
+                        logger.warning("Error checking if coupon is clipped: %s", e)
+                        connection_check_counter = connection_check_interval
+                        self.consecutive_success = 0
+                        i += 1
+                        continue
                     
-                    # Determine current delay based on consecutive successes
-                    current_min_delay = min_delay
-                    current_max_delay = max_delay
+                    # If slow start is enabled, start slower and speed up after
+                    # several consecutive successes, staying cautious after rate limits
+                    if not slow_start:
+                        delay_state = "normal"
+                    elif self.consecutive_success < acc_threshold:
+                        delay_state = "slow"
+                    elif self.rate_limit_hit:
+                        delay_state = "cautious"
+                    else:
+                        delay_state = "normal"
+                    current_min_delay, current_max_delay = delay_table[delay_state]
                     
-                    # If slow start is enabled, adapt delay based on consecutive successes
-                    if settings.get("slow_start", True) and not settings.get("enable_rapid_mode", False):
-                        if self.consecutive_success < settings.get("acceleration_threshold", 3):
-                            # Start slower
-                            current_min_delay = max(min_delay, min_delay * 1.5)
-                            current_max_delay = max(max_delay, max_delay * 1.5)
-                        elif self.rate_limit_hit:
-                            # If we've hit rate limits, be more cautious
-                            current_min_delay = max(min_delay, min_delay * 1.2)
-                            current_max_delay = max(max_delay, max_delay * 1.2)
-                        else:
-                            # We've had several consecutive successes, go faster
-                            current_min_delay = min_delay
-                            current_max_delay = max_delay
+                    # Stretch delays by up to 5x while rate limits are being detected
+                    current_min_delay *= self._delay_scale
+                    current_max_delay *= self._delay_scale
                     
-                    # Add delay before clicking
-                    time.sleep(random.uniform(current_min_delay, current_max_delay))
+                    # Add delay before clicking. Human pauses are skewed rather than uniform:
+                    # mostly near the middle of the range, now and then up to half again past
+                    # its top. Out-of-range draws are redrawn rather than clamped, so no exact
+                    # delay value repeats (unless a misconfigured range can't be hit at all)
+                    mid_delay = (current_min_delay + current_max_delay) / 2
+                    for _ in range(10):
+                        delay = mid_delay * lognormal(0.0, 0.4)
+                        if current_min_delay <= delay <= current_max_delay * 1.5:
+                            break
+                    else:
+                        delay = mid_delay
+                    sleep(delay)
                     
                     success = False
                     
-                    # Use the appropriate clicking strategy based on the website
-                    if website_key in ["weis", "harris_teeter"]:
-                        try:
-                            success = self._enhanced_click_button(button)
-                        except StaleElementReferenceException:
-                            # Button became stale, refresh our list
-                            logger.info("Button became stale during click, refreshing list")
-                            buttons_updated = True
-                            continue
-                        except Exception as e:
-                            logger.warning(f"Error with enhanced button click: {e}")
-                    else:
-                        # Standard clicking for other sites
-                        try:
-                            success = self._click_button(button)
-                        except StaleElementReferenceException:
-                            # Button became stale, refresh our list
-                            logger.info("Button became stale during click, refreshing list")
-                            buttons_updated = True
-                            continue
-                        except Exception as e:
-                            logger.warning(f"Error clicking button: {e}")
+                    try:
+                        success = click_button(button)
+                    except StaleElementReferenceException:
+                        # Button became stale, refresh our list
+                        logger.info("Button became stale during click, refreshing list")
+                        buttons_updated = True
+                        continue
+                    except WebDriverException as e:
+                        # The driver may be gone, so check the connection on the next pass
+                        logger.warning("Error clicking button: %s", e)
+                        connection_check_counter = connection_check_interval
                     
                     if success:
                         clipped_count += 1
                         self.consecutive_success += 1
                         
                         # In rapid mode, we only show progress periodically to reduce overhead
-                        if settings.get("enable_rapid_mode", False):
-                            if clipped_count % 5 == 0 or clipped_count == 1:
-                                logger.info(f"Clipped coupon ({clipped_count}/{total_buttons - already_clipped_count} unclipped) - consecutive: {self.consecutive_success}")
+                        if enable_rapid:
+                            if clipped_count == 1 or not (clipped_count & 3):
+                                logger.info("Clipped coupon (%s/%s unclipped) - consecutive: %s", clipped_count, total_buttons - already_clipped_count, self.consecutive_success)
                         else:
-                            logger.info(f"Clipped coupon ({clipped_count}/{total_buttons - already_clipped_count} unclipped) - consecutive: {self.consecutive_success}")
+                            logger.info("Clipped coupon (%s/%s unclipped) - consecutive: %s", clipped_count, total_buttons - already_clipped_count, self.consecutive_success)
                         
                         # Check for rate limiting - with improved detection
-                        # Skip rate limit checks in rapid mode to improve speed unless explicitly forced
-                        check_rate_limits = (not settings.get("enable_rapid_mode", False)) or settings.get("force_rate_limit_checks", False)
-                        
+                        # Rate limit checks are skipped in rapid mode unless explicitly forced
                         rate_limited = False
-                        if check_rate_limits and settings.get("enable_rate_limit_detection", True):
-                            rate_limited = self._is_rate_limited(website_config, settings)
+                        if check_rate_limits and enable_rld and clipped_count >= rl_next_check:
+                            rate_limited = is_rate_limited(website_config, settings)
+                            
+                            # Any sign of rate limiting, even below the threshold, resets the streak
+                            if rate_limited or self.rate_limit_times:
+                                rl_clean_streak = 0
+                            else:
+                                rl_clean_streak += 1
+                            rl_next_check = clipped_count + min(8, 1 << (rl_clean_streak // 20))
                             
-                            if rate_limited and settings.get("manual_rate_limit_confirmation", False):
+                            if rate_limited and manual_rl:
                                 # Ask user to confirm if we're actually rate limited
                                 print("\n" + "="*50)
                                 print("Potential rate limiting detected.")
@@ -838,40 +1487,41 @@ class CouponClipper:
                                     elif confirm == "3":
                                         rate_limited = False
                                         settings["enable_rate_limit_detection"] = False
+                                        enable_rld = False
                                         print("Automatic rate limit detection disabled for this session.")
                                 except KeyboardInterrupt:
                                     # If user presses Ctrl+C during input, assume they want to pause
                                     choice = self._control_menu(clipped_count, total_buttons - i - already_clipped_count)
                                     if choice != 'c':  # If not continue
-                                        return choice == 's'  # Return True if "s" (select new site), False otherwise
+                                        return choice != 's'  # Stop only on "s" (select new site)
                         
                         if rate_limited:
+                            # Multiplicative increase of the delays...
+                            self._delay_scale = min(5.0, self._delay_scale * 2.0)
                             self.rate_limit_hit = True
                             self.consecutive_success = 0
-                            buttons_updated = self._handle_rate_limit(settings)
+                            buttons_updated = handle_rate_limit(settings)
                             continue  # Skip incrementing index, as buttons list might have changed
                             
+                        # ...and additive decrease after each clean clip
+                        self._delay_scale = max(1.0, self._delay_scale - 0.1)
+                            
                         # Check for CAPTCHA if not in rapid mode (to reduce overhead)
-                        if not settings.get("enable_rapid_mode", False) and self._check_for_captcha(website_config):
+                        if captcha_check and check_for_captcha(website_config):
                             logger.info("CAPTCHA encountered and handled")
                             buttons_updated = True
                             continue  # Skip incrementing index, as buttons list might have changed
                             
-                        # Check if the page structure changes after clipping (especially for sites that remove clipped coupons)
-                        # Skip this check in rapid mode for compatible sites
-                        if not (settings.get("enable_rapid_mode", False) and settings.get("site_rapid_compatible", False)):
-                            try:
-                                # Quick check to see if button is still valid
-                                button.is_displayed()
-                            except StaleElementReferenceException:
-                                # Button is now stale, likely page updated
-                                logger.info("Page structure changed after clip, refreshing buttons")
-                                buttons_updated = True
-                                continue
+                        # If the page structure changes after clipping (especially for sites that
+                        # remove clipped coupons), it's noticed on the next button we touch: clicking it
+                        # (or checking it directly when the pre-check map has no entry for it) raises
+                        # StaleElementReferenceException, which refreshes the list. Buttons the map
+                        # already marks as clipped are skipped without touching the page, so it's
+                        # only noticed at the next unclipped button, which is where it matters
                     else:
                         # If click failed, reset consecutive success counter
                         self.consecutive_success = 0
-                        logger.warning(f"Failed to clip coupon at index {i}")
+                        logger.warning("Failed to clip coupon at index %s", i)
                     
                     # Move to next button
                     i += 1
@@ -880,9 +1530,9 @@ class CouponClipper:
                     # Show control menu when user presses Ctrl+C
                     choice = self._control_menu(clipped_count, total_buttons - i - already_clipped_count)
                     if choice == 'q':  # Quit this website
-                        return False
-                    elif choice == 's':  # Return to website selection
                         return True
+                    elif choice == 's':  # Return to website selection
+                        return False
                     elif choice == 'r':  # Reconnect to browser
                         logger.info("User requested browser reconnection")
                         
@@ -891,7 +1541,7 @@ class CouponClipper:
                         else:
                             # Try to reconnect
                             print("Attempting to reconnect to browser...")
-                            if self.check_driver_connection():
+                            if self._try_reconnect():
                                 print("Successfully reconnected to browser.")
                                 
                                 # Re-find buttons
@@ -900,55 +1550,137 @@ class CouponClipper:
                                     print("Could not find coupon buttons after reconnection. Skipping website.")
                                     return True
                                     
+                                total_buttons = len(coupon_buttons)
+                                buttons_fingerprint = None
+                                already_clipped_map = self._bulk_clipped_status(coupon_buttons, website_config)
                                 i = 0  # Reset counter
                                 already_clipped_count = 0
                                 clipped_count = 0
+                                rl_clean_streak = 0
+                                rl_next_check = 0
                                 buttons_updated = False
                             else:
                                 print("Failed to reconnect. Skipping to next website.")
                                 return True
                     # If 'c', we just continue the loop
                 except Exception as e:
-                    logger.warning(f"Error during coupon clipping: {e}")
+                    logger.warning("Error during coupon clipping: %s", e)
                     # If we get an error, move to the next button but reset consecutive success
                     self.consecutive_success = 0
                     i += 1
                     
-            logger.info(f"Finished clipping coupons for {website_key}. Clipped {clipped_count} coupons.")
+            logger.info("Finished clipping coupons for %s. Clipped %s coupons.", website_key, clipped_count)
             return True
             
         except KeyboardInterrupt:
             # Catch Ctrl+C at the outer level too
-            choice = self._control_menu(
-                clipped_count if 'clipped_count' in locals() else 0, 
-                (total_buttons - i - already_clipped_count) if 'i' in locals() and 'total_buttons' in locals() and 'already_clipped_count' in locals() else 0
-            )
+            choice = self._control_menu(clipped_count, total_buttons - i - already_clipped_count)
             if choice == 'q':  # Quit this website
-                return False
-            elif choice == 's':  # Return to website selection
                 return True
+            elif choice == 's':  # Return to website selection
+                return False
             else:
                 return True  # Continue with other websites
             
         except Exception as e:
-            logger.error(f"Error while clipping coupons: {e}")
+            logger.error("Error while clipping coupons: %s", e)
             print(f"\nAn error occurred: {e}")
             choice = input("\nContinue to next website? (y/n, default: y): ").lower() or 'y'
             return choice != 'n'  # Return True to continue with other websites unless user says no
     
-    def _ask_clip_speed_preference(self, settings, website_key=None):
+    def _wait_for_coupon_page(self, website_config, settings, timeout=10):
+        """
+        Wait until coupon buttons (clipped or not) are present on the page.
+        
+        Args:
+            website_config (dict): Website configuration
+            settings (dict): General settings
+            timeout (int): Maximum number of seconds to wait
+            
+        Returns:
+            bool: True if coupon elements appeared, False otherwise
+        """
+        compiled = website_config["_compiled"]
+        selectors = compiled["clip_selectors"] + compiled["clipped_selectors"]
+        if not selectors:
+            time.sleep(settings.get("random_delay_max", 3))
+            return False
+            
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(selectors)))
+            )
+            return True
+        except TimeoutException:
+            logger.info("Timed out waiting for coupon elements, continuing anyway")
+            return False
+        except WebDriverException as e:
+            # Selectors the browser can't parse - fall back to a fixed wait
+            logger.debug("Could not wait on coupon selectors: %s", e)
+            time.sleep(settings.get("random_delay_max", 3))
+            return False
+    
+    def clip_all(self, website_keys):
+        """
+        Clip coupons on several websites, loading every site in its own tab up front.
+        
+        All questions are asked first, then each site is opened in a background tab so
+        its page load overlaps with clipping the sites before it. The clipping itself
+        stays sequential: every site relies on the logins in the user's Chrome profile,
+        which only one browser can use at a time, and CAPTCHAs, rate limits and Ctrl+C
+        all hand control to the user at the console.
+        
+        Args:
+            website_keys (list): Website keys to clip, in order
+        """
+        website_keys = [key for key in website_keys if key in self.config["websites"]]
+        self.prepare(website_keys)
+        
+        if not self.driver:
+            self.setup_driver()
+            
+        # Open every site after the first in its own tab; window.open doesn't wait for the page
+        for website_key in website_keys[1:]:
+            try:
+                known_handles = set(self.driver.window_handles)
+                self.driver.execute_script("window.open(arguments[0], '_blank');",
+                                           self.config["websites"][website_key]["url"])
+                new_handles = [h for h in self.driver.window_handles if h not in known_handles]
+                if new_handles:
+                    self._tabs[website_key] = new_handles[0]
+            except Exception as e:
+                logger.warning("Could not preload %s in a new tab: %s", website_key, e)
+                
+        try:
+            for website_key in website_keys:
+                print(f"\nClipping coupons for {website_key}...")
+                if not self.clip_coupons(website_key):
+                    logger.info("Stopping before the remaining websites at the user's request")
+                    break
+        finally:
+            # Don't leave the choices or tabs of sites that weren't clipped for a later run
+            for website_key in website_keys:
+                self._site_prefs.pop(website_key, None)
+                self._tabs.pop(website_key, None)
+    
+    def _ask_clip_speed_preference(self, website_key=None):
         """
         Ask the user for their preferred clipping speed with site-specific options.
         
         Args:
-            settings (dict): Settings dictionary to update
             website_key (str): Current website key for site-specific options
+            
+        Returns:
+            dict: Settings to apply for the chosen speed
         """
+        prefs = {}
+        compiled = self.config["websites"][website_key]["_compiled"] if website_key else None
+        
         print("\nSelect clipping speed:")
         
         # Check if this site supports rapid mode
         site_specific_options = ""
-        if website_key and settings.get("site_rapid_compatible", False):
+        if compiled and compiled["rapid_mode_compatible"]:
             site_specific_options = f"\n5. Ultra Fast (Rapid Mode - optimized for {website_key})"
 
         print("1. Slow (safe, fewer rate limits)")
@@ -961,63 +1693,152 @@ class CouponClipper:
             speed_choice = input(f"Select option (1-{max_option}, default: 2): ") or "2"
             
             # Reset rapid mode flag
-            settings["enable_rapid_mode"] = False
+            prefs["enable_rapid_mode"] = False
             
             if speed_choice == "1":
                 # Slow
-                settings["random_delay_min"] = 1.5
-                settings["random_delay_max"] = 3.0
+                prefs["random_delay_min"] = 1.5
+                prefs["random_delay_max"] = 3.0
                 print("Slow clipping speed selected.")
             elif speed_choice == "3":
                 # Fast
-                settings["random_delay_min"] = 0.1
-                settings["random_delay_max"] = 0.5
+                prefs["random_delay_min"] = 0.1
+                prefs["random_delay_max"] = 0.5
                 print("Fast clipping speed selected.")
             elif speed_choice == "4":
                 # Custom
                 try:
                     min_delay = float(input("Enter minimum delay in seconds (default: 0.5): ") or "0.5")
                     max_delay = float(input("Enter maximum delay in seconds (default: 1.5): ") or "1.5")
-                    settings["random_delay_min"] = max(0.1, min_delay)  # Ensure minimum of 0.1s
-                    settings["random_delay_max"] = max(settings["random_delay_min"], max_delay)
-                    print(f"Custom timing set: {settings['random_delay_min']}-{settings['random_delay_max']} seconds.")
+                    prefs["random_delay_min"] = max(0.1, min_delay)  # Ensure minimum of 0.1s
+                    prefs["random_delay_max"] = max(prefs["random_delay_min"], max_delay)
+                    print(f"Custom timing set: {prefs['random_delay_min']}-{prefs['random_delay_max']} seconds.")
                 except ValueError:
                     print("Invalid input, using default medium speed.")
-                    settings["random_delay_min"] = 0.5
-                    settings["random_delay_max"] = 1.5
+                    prefs["random_delay_min"] = 0.5
+                    prefs["random_delay_max"] = 1.5
             elif speed_choice == "5" and site_specific_options:
                 # Rapid Mode for compatible sites
-                settings["enable_rapid_mode"] = True
-                settings["random_delay_min"] = settings.get("rapid_mode_min_delay", 0.05)
-                settings["random_delay_max"] = settings.get("rapid_mode_max_delay", 0.2)
+                prefs["enable_rapid_mode"] = True
+                prefs["random_delay_min"] = self.config["settings"].get("rapid_mode_min_delay", 0.05)
+                prefs["random_delay_max"] = self.config["settings"].get("rapid_mode_max_delay", 0.2)
                 print(f"Rapid mode enabled! Using ultra-fast timings optimized for {website_key}.")
                 print("This mode skips certain checks for maximum speed.")
             else:
                 # Medium (default)
-                settings["random_delay_min"] = 0.5
-                settings["random_delay_max"] = 1.5
+                prefs["random_delay_min"] = 0.5
+                prefs["random_delay_max"] = 1.5
                 print("Medium clipping speed selected.")
                 
             # Apply site-specific overrides if available and not using custom/rapid mode
-            if website_key and speed_choice not in ["4", "5"]:
-                site_settings = self.config["websites"][website_key].get("site_specific_settings", {})
-                if site_settings.get("min_delay_override") is not None:
-                    settings["random_delay_min"] = site_settings.get("min_delay_override")
-                    print(f"Applied {website_key}-specific minimum delay: {settings['random_delay_min']}s")
+            if compiled and speed_choice not in ["4", "5"]:
+                if compiled["min_delay_override"] is not None:
+                    prefs["random_delay_min"] = compiled["min_delay_override"]
+                    print(f"Applied {website_key}-specific minimum delay: {prefs['random_delay_min']}s")
                     
-                if site_settings.get("max_delay_override") is not None:
-                    settings["random_delay_max"] = site_settings.get("max_delay_override")
-                    print(f"Applied {website_key}-specific maximum delay: {settings['random_delay_max']}s")
+                if compiled["max_delay_override"] is not None:
+                    prefs["random_delay_max"] = compiled["max_delay_override"]
+                    print(f"Applied {website_key}-specific maximum delay: {prefs['random_delay_max']}s")
                 
         except Exception:
             # Use default values if any error occurs
-            settings["random_delay_min"] = 0.5
-            settings["random_delay_max"] = 1.5
+            prefs["random_delay_min"] = 0.5
+            prefs["random_delay_max"] = 1.5
+            
+        return prefs
+    
+    def _ask_rate_limit_preference(self, website_key):
+        """
+        Ask whether to use automatic rate limit detection on sites where it is unreliable.
+        
+        Args:
+            website_key (str): Website key to ask about
+            
+        Returns:
+            dict: Settings to apply for the chosen option (empty if nothing was asked)
+        """
+        prefs = {}
+        
+        # Ask user if they want to enable rate limit detection for this site
+        if website_key == "weis":
+            print("\nWeis Markets may have issues with automatic rate limit detection.")
+            print("1. Enable automatic rate limit detection (default)")
+            print("2. Disable automatic rate limit detection")
+            print("3. Manual mode - ask before applying rate limits")
+            
+            try:
+                rate_limit_choice = input("\nSelect option (1-3, default: 1): ") or "1"
+                
+                if rate_limit_choice == "2":
+                    prefs["enable_rate_limit_detection"] = False
+                    print("Automatic rate limit detection disabled.")
+                elif rate_limit_choice == "3":
+                    prefs["manual_rate_limit_confirmation"] = True
+                    print("Manual rate limit confirmation enabled.")
+                else:
+                    prefs["enable_rate_limit_detection"] = True
+                    prefs["manual_rate_limit_confirmation"] = False
+                    print("Automatic rate limit detection enabled.")
+            except ValueError:
+                # Default to enabling rate limit detection
+                prefs["enable_rate_limit_detection"] = True
+                prefs["manual_rate_limit_confirmation"] = False
+                
+        return prefs
+    
+    def prepare(self, website_keys):
+        """
+        Ask all per-site questions up front so clip_coupons can run without prompting.
+        
+        Args:
+            website_keys (list): Website keys that will be clipped
+        """
+        for website_key in website_keys:
+            if website_key not in self.config["websites"]:
+                continue
+                
+            print(f"\nSettings for {website_key}:")
+            prefs = self._ask_rate_limit_preference(website_key)
+            prefs.update(self._ask_clip_speed_preference(website_key))
+            self._site_prefs[website_key] = prefs
     
     def _find_coupon_buttons_for_website(self, website_key, website_config):
         """
         Find coupon buttons using the best strategy for each website.
         
+        Buttons found on a page with the same fingerprint are reused as long as
+        none of them has gone stale.
+        
+        Args:
+            website_key (str): The website key
+            website_config (dict): Website configuration
+            
+        Returns:
+            list: List of WebElement buttons
+        """
+        fingerprint = self._page_fingerprint()
+        key = (website_key, fingerprint)
+        buttons = self._find_memo.get(key) if fingerprint is not None else None
+        if buttons:
+            try:
+                # Passing a stale element to a script raises, so this checks them all at once
+                self.driver.execute_script("return arguments[0].length", buttons)
+                return buttons
+            except WebDriverException:
+                del self._find_memo[key]
+                
+        buttons = self._scan_coupon_buttons_for_website(website_key, website_config)
+        if buttons and fingerprint is not None:
+            # Only keep the few most recent pages
+            if len(self._find_memo) >= 4:
+                del self._find_memo[next(iter(self._find_memo))]
+            self._find_memo[key] = buttons
+        return buttons
+    
+    def _scan_coupon_buttons_for_website(self, website_key, website_config):
+        """
+        Search the page for coupon buttons using the best strategy for each website.
+        
         Args:
             website_key (str): The website key
             website_config (dict): Website configuration
@@ -1026,60 +1847,100 @@ class CouponClipper:
             list: List of WebElement buttons
         """
         if website_key == "weis":
-            # For Weis, try the specialized approach first
+            # For Weis, try the specialized approach first, which also finds "CLIP COUPON" text
             buttons = self._find_weis_buttons_directly()
             if buttons:
                 return buttons
                 
-            # Also try finding by text, especially "CLIP COUPON" for Weis
-            clip_buttons = self._find_buttons_by_text("CLIP COUPON")
-            if clip_buttons:
-                logger.info(f"Found {len(clip_buttons)} buttons with text 'CLIP COUPON'")
-                return clip_buttons
-                
         elif website_key == "harris_teeter":
             # For Harris Teeter, specifically look for "Clip" buttons
-            clip_buttons = self._find_buttons_by_text("Clip")
+            clip_buttons = self._query_text_selectors(website_config["_compiled"]["clip_text_selectors"])
+            if not clip_buttons:
+                clip_buttons = self._find_buttons_by_text("Clip", exclude_text="unclip")
             if clip_buttons:
-                # Filter out any that say "Unclip" - these are already clipped coupons
-                filtered_buttons = []
-                for button in clip_buttons:
-                    try:
-                        if "unclip" not in button.text.lower():
-                            filtered_buttons.append(button)
-                    except Exception:
-                        pass
+                # Filter out any that say "Unclip" - these are already clipped coupons.
+                # Read the text in the page in one call, since button.text is a round-trip each
+                try:
+                    filtered_buttons = self.driver.execute_script(
+                        "return arguments[0].filter(el => !(el.innerText || '').toLowerCase().includes('unclip'));",
+                        clip_buttons
+                    ) or []
+                except WebDriverException as e:
+                    # A stale element fails the whole call, so check them one at a time
+                    logger.debug("Bulk 'Unclip' filter failed, checking buttons individually: %s", e)
+                    filtered_buttons = []
+                    for button in clip_buttons:
+                        try:
+                            if "unclip" not in button.text.lower():
+                                filtered_buttons.append(button)
+                        except Exception:
+                            pass
                         
                 if filtered_buttons:
-                    logger.info(f"Found {len(filtered_buttons)} 'Clip' buttons (excluding 'Unclip')")
+                    logger.info("Found %s 'Clip' buttons (excluding 'Unclip')", len(filtered_buttons))
                     return filtered_buttons
         
         # For other sites or as fallback, use standard detection
         return self._find_coupon_buttons(website_config)
     
-    def _find_buttons_by_text(self, button_text):
+    def _query_buttons_by_text(self, tag, patterns):
+        """
+        Find elements whose text contains any of the given patterns in a single script call.
+        
+        Args:
+            tag (str): CSS selector for the candidate elements (e.g. 'button')
+            patterns (list): Case-sensitive text fragments to look for
+            
+        Returns:
+            list: List of matching WebElements
+        """
+        try:
+            return self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".filter(e => arguments[1].some(p => e.textContent.includes(p)));",
+                tag, list(patterns)
+            ) or []
+        except Exception as e:
+            logger.warning("Error finding elements by text with %s: %s", tag, e)
+            return []
+    
+    def _query_text_selectors(self, text_selectors):
+        """
+        Resolve compiled (css, text) selector pairs, issuing one script call per CSS selector.
+        
+        Args:
+            text_selectors (tuple): (css, text) pairs from the compiled website config
+            
+        Returns:
+            list: List of matching WebElements
+        """
+        patterns_by_css = {}
+        for css, text in text_selectors:
+            patterns_by_css.setdefault(css, []).append(text)
+            
+        elements = []
+        for css, patterns in patterns_by_css.items():
+            elements.extend(self._query_buttons_by_text(css, patterns))
+        return elements
+    
+    def _find_buttons_by_text(self, button_text, exclude_text=None):
         """
         Find buttons by their text content.
         
+        Tries an exact (case-sensitive) match, falling back to a case-insensitive
+        partial match, in a single script call.
+        
         Args:
             button_text (str): The text to look for
+            exclude_text (str): Lowercase text that rules a partial match out
             
         Returns:
             list: List of WebElement buttons
         """
         try:
-            # First try exact text (case-sensitive)
-            xpath = f"//*[text()='{button_text}']"
-            buttons = self.driver.find_elements(By.XPATH, xpath)
-            
-            if not buttons:
-                # Try case-insensitive match
-                xpath = f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{button_text.lower()}')]"
-                buttons = self.driver.find_elements(By.XPATH, xpath)
-                
-            return buttons
+            return self.driver.execute_script(_XPATH_FALLBACK_JS, *_text_button_xpath(button_text, exclude_text)) or []
         except Exception as e:
-            logger.warning(f"Error finding buttons by text: {e}")
+            logger.warning("Error finding buttons by text: %s", e)
             return []
     
     def _load_all_content(self, website_config, settings):
@@ -1097,8 +1958,13 @@ class CouponClipper:
         load_more_attempts = 0
         max_attempts = settings.get("load_more_max_attempts", 10)
         
-        # Initial wait for the page to load any dynamic content
-        time.sleep(3)
+        # Initial wait for the page to finish loading
+        try:
+            WebDriverWait(self.driver, 3, poll_frequency=0.25).until(
+                lambda d: self._cdp_eval("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            pass
         
         # Limit the number of attempts to avoid infinite loops
         max_iterations = 5  # Set a hard limit on the number of load/scroll cycles
@@ -1106,49 +1972,51 @@ class CouponClipper:
         
         # Keep clicking load more and scrolling until we can't anymore
         content_changed = True
-        previous_page_source_length = len(self.driver.page_source)
+        previous_fingerprint = self._page_fingerprint()
         
         while content_changed and load_more_attempts < max_attempts and iterations < max_iterations:
             iterations += 1
-            logger.info(f"Content loading iteration {iterations}/{max_iterations}")
+            logger.info("Content loading iteration %s/%s", iterations, max_iterations)
             
             # Scroll through the page to reveal any lazy-loaded content or buttons
             self._scroll_to_load_all(settings)
             
             # Try to find and click a load more button
             load_more_button_clicked = False
+            content_grew = False
             
             try:
                 # Try to click a load more button
+                # Check if the page height or number of buttons has changed. Without a
+                # click the page is as it was after scrolling, so no need to check again
+                current_fingerprint = self._page_fingerprint()
                 if self._click_load_more_button(website_config):
                     load_more_attempts += 1
                     load_more_button_clicked = True
-                    logger.info(f"Clicked 'load more' button ({load_more_attempts}/{max_attempts})")
+                    logger.info("Clicked 'load more' button (%s/%s)", load_more_attempts, max_attempts)
                     
-                    # Give extra time for content to load
-                    time.sleep(3)
+                    # Give content up to a few seconds to appear
+                    current_fingerprint = self._wait_for_fingerprint_change(current_fingerprint, timeout=3)
                 
-                # Check if the page content has changed significantly
-                current_length = len(self.driver.page_source)
-                content_growth = current_length - previous_page_source_length
+                content_grew = current_fingerprint != previous_fingerprint
                 
-                logger.info(f"Content size change: {content_growth} bytes")
+                logger.info("Page height and button count: %s -> %s", previous_fingerprint, current_fingerprint)
                 
-                # If we clicked a button but content didn't grow much, we may be done
-                if load_more_button_clicked and content_growth < 500:
-                    logger.info("Clicked load more but content didn't change significantly")
+                # If we clicked a button but content didn't change, we may be done
+                if load_more_button_clicked and not content_grew:
+                    logger.info("Clicked load more but content didn't change")
                     # One more attempt to scroll and check
                     self._scroll_to_load_all(settings)
-                    current_length = len(self.driver.page_source)
-                    if current_length - previous_page_source_length < 500:
-                        logger.info("Confirmed no significant content change, all content may be loaded")
+                    current_fingerprint = self._page_fingerprint()
+                    if current_fingerprint == previous_fingerprint:
+                        logger.info("Confirmed no content change, all content may be loaded")
                         content_changed = False
                     else:
-                        previous_page_source_length = current_length
-                elif content_growth > 500:
-                    # Content changed significantly, continue loading
-                    logger.info(f"Content grew by {content_growth} bytes")
-                    previous_page_source_length = current_length
+                        previous_fingerprint = current_fingerprint
+                elif content_grew:
+                    # Content changed, continue loading
+                    logger.info("Content changed, continuing to load")
+                    previous_fingerprint = current_fingerprint
                     content_changed = True
                 else:
                     # Content didn't change and no button was clicked, we're probably done
@@ -1157,18 +2025,18 @@ class CouponClipper:
                         content_changed = False
                         
             except Exception as e:
-                logger.warning(f"Error in content loading process: {e}")
+                logger.warning("Error in content loading process: %s", e)
                 iterations += 1  # Increment to avoid getting stuck
                 
-            # Safety check - if we're seeing minimal changes after multiple iterations, stop
-            if iterations > 2 and content_growth < 1000:
-                logger.info("Minimal content growth after multiple attempts, ending content loading")
+            # Safety check - if nothing changed after multiple iterations, stop
+            if iterations > 2 and not content_grew:
+                logger.info("No content growth after multiple attempts, ending content loading")
                 break
                 
         if load_more_attempts >= max_attempts:
-            logger.info(f"Reached maximum number of 'load more' attempts ({max_attempts})")
+            logger.info("Reached maximum number of 'load more' attempts (%s)", max_attempts)
         elif iterations >= max_iterations:
-            logger.info(f"Reached maximum number of content loading iterations ({max_iterations})")
+            logger.info("Reached maximum number of content loading iterations (%s)", max_iterations)
         
         # One final complete page scroll to ensure everything is loaded
         self._scroll_to_load_all(settings)
@@ -1181,61 +2049,123 @@ class CouponClipper:
         """
         logger.info("Scrolling to load all coupons...")
         
-        # Get scroll height
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        
         # Add a maximum number of scroll attempts to prevent infinite loops
         max_scroll_attempts = 3
-        scroll_attempts = 0
         
         # Use faster scrolling if enabled
         if settings.get("fast_scroll", True):
-            # Faster scrolling with fewer increments
-            while scroll_attempts < max_scroll_attempts:
-                scroll_attempts += 1
-                
-                # Scroll down in fewer larger jumps
-                for i in range(0, last_height, settings.get("scroll_increment", 500)):
-                    self.driver.execute_script(f"window.scrollTo(0, {i});")
-                    # Very brief pause between jumps
-                    time.sleep(0.2)  
-                
-                # Brief pause at the bottom
-                time.sleep(settings.get("scroll_pause_time", 0.8))
-                
-                # Calculate new scroll height and compare with last scroll height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    logger.info(f"Page height unchanged after scroll attempt {scroll_attempts}, finished scrolling")
-                    break
-                    
-                logger.info(f"Page height changed from {last_height} to {new_height} on scroll attempt {scroll_attempts}/{max_scroll_attempts}")
-                last_height = new_height
+            # Faster scrolling with fewer, larger jumps and a very brief pause between them
+            increment = settings.get("scroll_increment", 500)
+            bottom_pause = settings.get("scroll_pause_time", 0.8)
+            step_pause = 0.2
         else:
             # Original slower scrolling method
-            while scroll_attempts < max_scroll_attempts:
-                scroll_attempts += 1
+            increment = settings.get("scroll_increment", 300)
+            bottom_pause = settings.get("scroll_pause_time", 1.5)
+            step_pause = bottom_pause / 3
+            
+        # Scroll inside the page in one call, falling back to scrolling step by step
+        heights = self._scroll_in_page(increment, step_pause, bottom_pause, max_scroll_attempts)
+        if heights is None:
+            heights = self._scroll_stepwise(increment, step_pause, bottom_pause, max_scroll_attempts)
+            
+        for attempt in range(1, len(heights)):
+            if heights[attempt] == heights[attempt - 1]:
+                logger.info("Page height unchanged after scroll attempt %s, finished scrolling", attempt)
+            else:
+                logger.info("Page height changed from %s to %s on scroll attempt %s/%s", heights[attempt - 1], heights[attempt], attempt, max_scroll_attempts)
                 
-                # Scroll down by increments
-                for i in range(0, last_height, settings.get("scroll_increment", 300)):
-                    self.driver.execute_script(f"window.scrollTo(0, {i});")
-                    time.sleep(settings.get("scroll_pause_time", 1.5) / 3)
-                    
-                # Wait to load page
-                time.sleep(settings.get("scroll_pause_time", 1.5))
+        logger.info("Finished scrolling")
+    
+    def _scroll_in_page(self, increment, step_pause, bottom_pause, max_attempts):
+        """
+        Scroll through the page from inside the browser until its height stops growing.
+        
+        The whole scroll runs in one WebDriver call and returns to the top when done.
+        
+        Args:
+            increment (int): Pixels to scroll per step
+            step_pause (float): Seconds to pause between steps
+            bottom_pause (float): Seconds to wait at the bottom for content to load
+            max_attempts (int): Maximum number of passes through the page
+            
+        Returns:
+            list: Page height before scrolling and after each pass, or None if the scroll failed
+        """
+        try:
+            self.driver.set_script_timeout(60)
+            return self.driver.execute_async_script("""
+                const increment = Math.max(1, arguments[0]), stepMs = arguments[1], pauseMs = arguments[2];
+                const maxAttempts = arguments[3], done = arguments[arguments.length - 1];
+                const heights = [document.body.scrollHeight];
+                // Finish well within the script timeout, even on a page that never stops growing
+                const deadline = Date.now() + 45000;
+                // Steps and pauses vary by up to 20%/30% either way, averaging the configured values.
+                // The live height is used, so content that loads mid-pass is scrolled through
+                // in the same pass instead of costing another wait at the bottom
+                function scrollPass(y) {
+                    if (y >= document.body.scrollHeight || Date.now() > deadline) {
+                        setTimeout(checkHeight, pauseMs);
+                        return;
+                    }
+                    window.scrollTo(0, y);
+                    const step = Math.round(increment * (0.8 + 0.4 * Math.random()));
+                    setTimeout(() => scrollPass(y + step), stepMs * (0.7 + 0.6 * Math.random()));
+                }
+                function checkHeight() {
+                    const height = document.body.scrollHeight;
+                    const grew = height !== heights[heights.length - 1];
+                    heights.push(height);
+                    // Return as soon as the height stops growing
+                    if (!grew || heights.length > maxAttempts || Date.now() > deadline) {
+                        window.scrollTo(0, 0);
+                        done(heights);
+                        return;
+                    }
+                    scrollPass(0);
+                }
+                scrollPass(0);
+            """, increment, int(step_pause * 1000), int(bottom_pause * 1000), max_attempts)
+        except Exception as e:
+            logger.debug("In-page scroll failed, scrolling step by step: %s", e)
+            return None
+        finally:
+            try:
+                self.driver.set_script_timeout(30)
+            except Exception:
+                pass
+    
+    def _scroll_stepwise(self, increment, step_pause, bottom_pause, max_attempts):
+        """
+        Scroll through the page one WebDriver call at a time until its height stops growing.
+        
+        Args:
+            increment (int): Pixels to scroll per step
+            step_pause (float): Seconds to pause between steps
+            bottom_pause (float): Seconds to wait at the bottom for content to load
+            max_attempts (int): Maximum number of passes through the page
+            
+        Returns:
+            list: Page height before scrolling and after each pass
+        """
+        # Start from the top, reading the height in the same call
+        heights = [self.driver.execute_script("window.scrollTo(0, 0); return document.body.scrollHeight;")]
+        
+        while True:
+            # Scroll down by increments
+            for i in range(increment, heights[-1], increment):
+                self.driver.execute_script("window.scrollTo(0, arguments[0]);", i)
+                time.sleep(step_pause)
                 
-                # Calculate new scroll height and compare with last scroll height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    logger.info(f"Page height unchanged after scroll attempt {scroll_attempts}, finished scrolling")
-                    break
-                    
-                logger.info(f"Page height changed from {last_height} to {new_height} on scroll attempt {scroll_attempts}/{max_scroll_attempts}")
-                last_height = new_height
+            # Wait to load page
+            time.sleep(bottom_pause)
             
-        # Scroll back to top
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        logger.info("Finished scrolling")
+            # Scroll back to top and get the new height in one call, then compare with the last height
+            heights.append(self.driver.execute_script("window.scrollTo(0, 0); return document.body.scrollHeight;"))
+            if heights[-1] == heights[-2] or len(heights) > max_attempts:
+                break
+                
+        return heights
     
     def _check_for_captcha(self, website_config):
         """
@@ -1245,108 +2175,64 @@ class CouponClipper:
             bool: True if CAPTCHA was detected and handled, False otherwise
         """
         try:
-            # Check for specific CAPTCHA elements (more reliable)
-            captcha_detected = False
-            
-            # Check for CloudFlare CAPTCHA specifically
-            cloudflare_indicators = [
-                "#challenge-running",
-                "#challenge-form",
-                ".cf-browser-verification",
-                "#cf-please-wait",
-                "#cf-content"
-            ]
-            
-            for indicator in cloudflare_indicators:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, indicator)
-                    if elements and any(e.is_displayed() for e in elements):
-                        captcha_detected = True
-                        logger.info(f"CloudFlare CAPTCHA detected via element: {indicator}")
-                        break
-                except Exception:
-                    pass
-            
-            # Look for reCAPTCHA iframes
-            if not captcha_detected:
-                for indicator in website_config.get("captcha_indicators", []):
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, indicator)
-                        if elements and any(e.is_displayed() for e in elements):
-                            captcha_detected = True
-                            logger.info(f"CAPTCHA detected via element: {indicator}")
-                            break
-                    except Exception:
-                        pass
-            
-            # Look for specific CAPTCHA UI elements
-            if not captcha_detected:
-                captcha_selectors = [
-                    ".g-recaptcha",
-                    "#captcha",
-                    "[name='captcha']",
-                    "[id*='captcha']",
-                    "[class*='captcha']",
-                    ".recaptcha-checkbox"
-                ]
+            # One probe for the common no-CAPTCHA case: specific CAPTCHA elements (more
+            # reliable) first - CloudFlare, then reCAPTCHA iframes and other CAPTCHA UI -
+            # then a CloudFlare interstitial title, then explicit CAPTCHA phrases in the body
+            try:
+                probe = self._cdp_eval(_FIRST_VISIBLE_SELECTOR_JS + """
+                    const sel = firstVisibleSelector(arguments[0]);
+                    if (sel) return {selector: sel};
+                    if (document.title.toLowerCase().includes('just a moment')) return {title: document.title};
+                    const text = document.body ? document.body.innerText.toLowerCase() : '';
+                    const phrase = arguments[1].find(p => text.includes(p));
+                    return phrase ? {phrase: phrase} : null;
+                """, list(website_config["_compiled"]["captcha_probe_selectors"]), list(_CAPTCHA_PHRASES))
+            except WebDriverException as e:
+                logger.debug("CAPTCHA check failed: %s", e)
+                probe = None
                 
-                for selector in captcha_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements and any(e.is_displayed() for e in elements):
-                            captcha_detected = True
-                            logger.info(f"CAPTCHA detected via selector: {selector}")
-                            break
-                    except Exception:
-                        pass
-            
-            # Check for explicit CAPTCHA phrases
-            if not captcha_detected:
-                # Get text from the main content body only
-                try:
-                    body_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-                    captcha_phrases = [
-                        "complete the captcha",
-                        "solve the captcha",
-                        "i'm not a robot",
-                        "security check",
-                        "checking your browser",
-                        "please enable javascript",
-                        "please wait while we verify",
-                        "please wait..." # CloudFlare indicator
-                    ]
-                    
-                    for phrase in captcha_phrases:
-                        if phrase in body_text:
-                            # Only if the phrase is prominent (not in footer or hidden)
-                            captcha_detected = True
-                            logger.info(f"CAPTCHA detected via text phrase: '{phrase}'")
-                            break
-                except Exception:
-                    pass
-            
-            if not captcha_detected:
+            if not probe:
                 return False
                 
+            # The probe checks CloudFlare elements first and only reports the "Just a moment"
+            # interstitial title when nothing matched, so its result says whether CloudFlare is active
+            cf_active = "title" in probe or probe.get("selector") in _CLOUDFLARE_INDICATORS
+            if "selector" in probe:
+                if cf_active:
+                    logger.info("CloudFlare CAPTCHA detected via element: %s", probe['selector'])
+                else:
+                    logger.info("CAPTCHA detected via element: %s", probe['selector'])
+            elif "title" in probe:
+                logger.info("CloudFlare CAPTCHA detected via page title: '%s'", probe['title'])
+            else:
+                logger.info("CAPTCHA detected via text phrase: '%s'", probe['phrase'])
+                
             logger.info("CAPTCHA detected")
             
             # For CloudFlare CAPTCHA, just wait longer
-            if any(self.driver.find_elements(By.CSS_SELECTOR, indicator) for indicator in cloudflare_indicators):
+            if cf_active:
                 print("\n" + "="*50)
                 print("CloudFlare security check detected. Waiting for completion...")
                 print("If prompted, please complete any verification manually.")
                 print("="*50)
                 
-                # Wait longer for CloudFlare to resolve automatically
-                time.sleep(10)
-                
-                # Check if CloudFlare is still active
-                if any(self.driver.find_elements(By.CSS_SELECTOR, indicator) for indicator in cloudflare_indicators):
-                    self._user_solve_captcha()
-                    return True
+                # Give CloudFlare up to 10 seconds to resolve automatically, carrying on
+                # as soon as its elements (or its interstitial title) are gone
+                if "title" in probe:
+                    try:
+                        WebDriverWait(self.driver, 10, poll_frequency=0.5).until(
+                            lambda driver: "just a moment" not in driver.title.lower()
+                        )
+                        cf_cleared = True
+                    except TimeoutException:
+                        cf_cleared = False
                 else:
+                    cf_cleared = self._wait_until_hidden(_CLOUDFLARE_INDICATORS, 10)
+                if cf_cleared:
                     logger.info("CloudFlare check completed automatically")
-                    return True
+                else:
+                    self._user_solve_captcha(_CLOUDFLARE_INDICATORS, check_title="title" in probe)
+                return True
             
             # For other CAPTCHAs, try refreshing first
             logger.info("Attempting to refresh the page to bypass CAPTCHA")
@@ -1354,130 +2240,173 @@ class CouponClipper:
             time.sleep(5)  # Wait for page to reload
             
             # Check if CAPTCHA is still there after refresh
-            if any(any(self.driver.find_elements(By.CSS_SELECTOR, indicator)) for indicator in captcha_selectors + website_config.get("captcha_indicators", [])):
+            if self._first_visible_selector(website_config["_compiled"]["captcha_recheck_selectors"]):
                 logger.info("CAPTCHA persists after refresh, handing off to user")
-                self._user_solve_captcha()
+                self._user_solve_captcha(website_config["_compiled"]["captcha_recheck_selectors"])
                 return True
             
             return False
             
         except Exception as e:
-            logger.error(f"Error in CAPTCHA detection: {e}")
+            logger.error("Error in CAPTCHA detection: %s", e)
             return False
     
-    def _user_solve_captcha(self):
+    def _first_visible_selector(self, selectors):
+        """
+        Find the first selector that matches a visible element, in a single script call.
+        
+        Args:
+            selectors (list): CSS selectors to check, in order
+            
+        Returns:
+            str: The first selector with a visible match, or None if there is none
+        """
+        return self._cdp_eval(_FIRST_VISIBLE_SELECTOR_JS + "return firstVisibleSelector(arguments[0]);", list(selectors))
+    
+    def _user_solve_captcha(self, selectors, timeout=120, check_title=False):
         """
         Prompt the user to solve the CAPTCHA manually.
+        
+        Continues as soon as the user presses Enter, or by itself once the CAPTCHA
+        is solved (a filled reCAPTCHA response) or its elements disappear. Falls back
+        to waiting for Enter if neither happens before the timeout. Windows consoles
+        can't be polled, so there the page is only watched for up to 30 seconds.
+        
+        Args:
+            selectors (list): CSS selectors for the CAPTCHA elements
+            timeout (int): Maximum number of seconds to watch for the CAPTCHA to clear
+            check_title (bool): Also wait for a CloudFlare "Just a moment" title to go away
         """
         print("\n" + "="*50)
         print("CAPTCHA detected! Please solve it manually in the browser.")
+        print("Press Enter once it's solved - clipping also continues automatically")
+        print("when the CAPTCHA clears.")
         print("="*50)
         
+        can_poll_stdin = _SYSTEM != "Windows" and sys.stdin.isatty()
+        deadline = time.monotonic() + (timeout if can_poll_stdin else min(timeout, 30))
+        while time.monotonic() < deadline:
+            if can_poll_stdin:
+                ready, _, _ = select.select([sys.stdin], [], [], 2)
+                if ready:
+                    sys.stdin.readline()
+                    logger.info("User indicated CAPTCHA has been solved, continuing")
+                    return
+            else:
+                time.sleep(2)
+                
+            try:
+                cleared = self._cdp_eval(_FIRST_VISIBLE_SELECTOR_JS + """
+                    if (arguments[1] && document.title.toLowerCase().includes('just a moment')) return false;
+                    if ([...document.querySelectorAll("[name='g-recaptcha-response']")].some(t => t.value)) return true;
+                    return !firstVisibleSelector(arguments[0]);
+                """, list(selectors), check_title)
+            except WebDriverException as e:
+                # Usually the page navigated, e.g. once the CAPTCHA was accepted
+                logger.debug("Could not check CAPTCHA state: %s", e)
+                cleared = False
+            if cleared:
+                logger.info("CAPTCHA cleared, continuing")
+                return
+                
         input("Press Enter when you've solved the CAPTCHA to continue...")
         logger.info("User indicated CAPTCHA has been solved, continuing")
+        
+    def _wait_until_hidden(self, selectors, timeout):
+        """
+        Wait until none of the selectors match a visible element, polling inside the page.
+        
+        The polling interval grows from 0.5 to 5 seconds, all in a single script call.
+        
+        Args:
+            selectors (list): CSS selectors to watch
+            timeout (float): Maximum number of seconds to wait
+            
+        Returns:
+            bool: True if the elements disappeared, False if they were still showing at the timeout
+        """
+        try:
+            self.driver.set_script_timeout(timeout + 10)
+            return bool(self.driver.execute_async_script(_FIRST_VISIBLE_SELECTOR_JS + """
+                const selectors = arguments[0], deadline = Date.now() + arguments[1];
+                const done = arguments[arguments.length - 1];
+                let delay = 500;
+                (function tick() {
+                    if (!firstVisibleSelector(selectors)) { done(true); return; }
+                    if (Date.now() >= deadline) { done(false); return; }
+                    delay = Math.min(delay * 1.3, 5000);
+                    setTimeout(tick, Math.min(delay, deadline - Date.now()));
+                })();
+            """, list(selectors), int(timeout * 1000)))
+        except WebDriverException as e:
+            # Usually the page navigated mid-wait, e.g. once a check passed, so look once more
+            logger.debug("Stopped waiting for elements to disappear: %s", e)
+            try:
+                return self._first_visible_selector(selectors) is None
+            except WebDriverException:
+                return False
+        finally:
+            try:
+                self.driver.set_script_timeout(30)
+            except Exception:
+                pass
     
     def _check_actual_login_required(self):
         """
         Improved login detection that checks if login is actually required and prominent,
         not just mentioned somewhere on the page.
         
+        All checks run inside the page in a single script call.
+        
         Returns:
             bool: True if login appears to be required, False otherwise
         """
         try:
-            # Check for login forms that are visible and in prominent positions
-            login_form_indicators = [
-                "form[action*='login']",
-                "form[action*='signin']",
-                "form.login-form",
-                "#login-form",
-                ".login-form",
-                "form.signin-form",
-                "#signin-form",
-                ".signin-form"
-            ]
-            
-            for indicator in login_form_indicators:
-                try:
-                    forms = self.driver.find_elements(By.CSS_SELECTOR, indicator)
-                    if forms and any(form.is_displayed() for form in forms):
-                        # Check if the form is in a prominent position
-                        for form in forms:
-                            if form.is_displayed():
-                                # Check position relative to viewport
-                                position = self.driver.execute_script("""
-                                    var rect = arguments[0].getBoundingClientRect();
-                                    return {
-                                        top: rect.top,
-                                        left: rect.left,
-                                        width: rect.width,
-                                        height: rect.height,
-                                        windowHeight: window.innerHeight,
-                                        windowWidth: window.innerWidth
-                                    };
-                                """, form)
-                                
-                                # If form is prominent (in the upper half of the screen and reasonably sized)
-                                if (position['top'] < position['windowHeight'] / 2 and 
-                                    position['width'] > 200 and position['height'] > 100):
-                                    logger.info(f"Login form detected in prominent position: {indicator}")
-                                    return True
-                except Exception:
-                    pass
-            
-            # Check for visible login buttons/links in main content areas
-            login_button_indicators = [
-                "button:contains('Sign In')",
-                "button:contains('Log In')",
-                "a:contains('Sign In')",
-                "a:contains('Log In')"
-            ]
-            
-            for xpath in login_button_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, xpath)
-                    if elements:
-                        for element in elements:
-                            if element.is_displayed():
-                                # Check position
-                                position = self.driver.execute_script("""
-                                    var rect = arguments[0].getBoundingClientRect();
-                                    return {
-                                        top: rect.top,
-                                        isMainContent: rect.top < window.innerHeight / 2
-                                    };
-                                """, element)
-                                
-                                if position['isMainContent']:
-                                    logger.info(f"Login button detected in main content: {xpath}")
-                                    return True
-                except Exception:
-                    pass
-            
-            # Check for clear login messaging in main content
-            main_content_selectors = ["main", "#main", ".main-content", "#content", ".content"]
-            login_phrases = [
-                "please log in to view coupons",
-                "please sign in to view coupons",
-                "login required to see coupons",
-                "sign in required to see coupons",
-                "log in to clip coupons",
-                "sign in to clip coupons"
-            ]
-            
-            for selector in main_content_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            element_text = element.text.lower()
-                            if any(phrase in element_text for phrase in login_phrases):
-                                logger.info(f"Login message found in main content: {selector}")
-                                return True
-                except Exception:
-                    pass
+            found = self._cdp_eval("""
+                const [formSelectors, mainSelector, buttonTexts, phrases] = arguments;
+                const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+                const half = window.innerHeight / 2;
+                
+                // Login forms that are visible, in the upper half of the screen and reasonably sized
+                for (const sel of formSelectors) {
+                    for (const form of document.querySelectorAll(sel)) {
+                        const rect = form.getBoundingClientRect();
+                        if (visible(form) && rect.top < half && rect.width > 200 && rect.height > 100) {
+                            return {form: sel};
+                        }
+                    }
+                }
+                
+                const mains = [...document.querySelectorAll(mainSelector)].filter(visible);
+                
+                // Visible login buttons/links in the upper half of the main content
+                for (const main of mains) {
+                    for (const el of main.querySelectorAll('button, a')) {
+                        const text = (el.textContent || '').replace(/\\s+/g, ' ').toLowerCase();
+                        const label = buttonTexts.find(t => text.includes(t));
+                        if (label && visible(el) && el.getBoundingClientRect().top < half) return {button: label};
+                    }
+                }
+                
+                // Clear login messaging in main content
+                for (const main of mains) {
+                    const text = (main.innerText || '').toLowerCase();
+                    const phrase = phrases.find(p => text.includes(p));
+                    if (phrase) return {phrase: phrase};
+                }
+                return null;
+            """, list(_LOGIN_FORM_SELECTORS), ", ".join(_MAIN_CONTENT_SELECTORS), list(_LOGIN_BUTTON_TEXTS), list(_LOGIN_PHRASES))
             
-            return False
+            if not found:
+                return False
+                
+            if "form" in found:
+                logger.info("Login form detected in prominent position: %s", found["form"])
+            elif "button" in found:
+                logger.info("Login button detected in main content: '%s'", found["button"])
+            else:
+                logger.info("Login message found in main content: '%s'", found["phrase"])
+            return True
             
         except Exception as e:
             logger.error(f"Error in login detection: {e}")
@@ -1496,59 +2425,48 @@ class CouponClipper:
         if "load_more_button_selector" not in website_config:
             return False
             
-        selector = website_config["load_more_button_selector"]
+        compiled = website_config["_compiled"]
         try:
-            # First try the provided CSS selector
-            buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            # First try the provided CSS selectors
+            buttons = []
+            if compiled["load_more_css"]:
+                buttons = self.driver.find_elements(By.CSS_SELECTOR, compiled["load_more_css"])
+            
+            # Then any text-based selectors from the config
+            if not buttons and compiled["load_more_text_selectors"]:
+                buttons = self._query_text_selectors(compiled["load_more_text_selectors"])
             
             # If no buttons found, try text-based search
             if not buttons:
-                for text in ["load more", "show more", "view more", "more coupons", "see more"]:
-                    xpath = f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text}')]"
-                    text_buttons = self.driver.find_elements(By.XPATH, xpath)
-                    if text_buttons:
-                        buttons = text_buttons
-                        break
+                buttons = self.driver.find_elements(By.XPATH, _LOAD_MORE_TEXT_XPATH)
             
             # If still no buttons, try common attribute-based selectors
             if not buttons:
-                attribute_selectors = [
-                    "[id*='load-more']", 
-                    "[id*='loadMore']", 
-                    "[class*='load-more']", 
-                    "[class*='loadMore']"
-                ]
-                
-                for attr_selector in attribute_selectors:
-                    attr_buttons = self.driver.find_elements(By.CSS_SELECTOR, attr_selector)
-                    if attr_buttons:
-                        buttons = attr_buttons
-                        break
+                buttons = self.driver.find_elements(By.CSS_SELECTOR, _LOAD_MORE_ATTRIBUTE_CSS)
             
             # Try to find a visible and clickable button
-            for button in buttons:
+            for button in self._unique_visible_elements(buttons, enabled_only=True):
                 try:
-                    if button.is_displayed() and (button.tag_name != "button" or button.is_enabled()):
-                        # Scroll to center the button
-                        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
-                        time.sleep(0.5)
-                        
-                        # Try multiple approaches to click
-                        try:
-                            # Try a regular click
-                            button.click()
-                        except Exception:
-                            # Try JS click if regular click fails
-                            self.driver.execute_script("arguments[0].click();", button)
-                        
-                        return True
+                    # Scroll to center the button
+                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
+                    time.sleep(0.5)
+                    
+                    # Try multiple approaches to click
+                    try:
+                        # Try a regular click
+                        button.click()
+                    except Exception:
+                        # Try JS click if regular click fails
+                        self.driver.execute_script("arguments[0].click();", button)
+                    
+                    return True
                 except Exception:
                     pass
             
             return False
             
         except Exception as e:
-            logger.debug(f"Error in load more button detection: {e}")
+            logger.debug("Error in load more button detection: %s", e)
             return False
     
     def _find_coupon_buttons(self, website_config):
@@ -1561,183 +2479,262 @@ class CouponClipper:
         try:
             # Try direct CSS selector approach first
             if "coupon_button_selector" in website_config:
-                selectors = website_config["coupon_button_selector"].split(", ")
-                for selector in selectors:
-                    try:
-                        buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                compiled = website_config["_compiled"]
+                try:
+                    # All the CSS selectors in one query
+                    if compiled["clip_css"]:
+                        buttons = self.driver.find_elements(By.CSS_SELECTOR, compiled["clip_css"])
                         if buttons:
-                            logger.info(f"Found {len(buttons)} buttons with selector: {selector}")
+                            logger.info("Found %s buttons with selectors: %s", len(buttons), compiled["clip_css"])
                             all_buttons.extend(buttons)
-                    except Exception:
-                        pass
+                except WebDriverException:
+                    # One selector the browser can't parse fails the whole query, so try them one at a time
+                    for selector in compiled["clip_selectors"]:
+                        try:
+                            buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                            if buttons:
+                                logger.info("Found %s buttons with selector: %s", len(buttons), selector)
+                                all_buttons.extend(buttons)
+                        except Exception:
+                            pass
+                
+                # Selectors using :contains() are matched by text in a single script call
+                text_selectors = website_config["_compiled"]["clip_text_selectors"]
+                if text_selectors:
+                    buttons = self._query_text_selectors(text_selectors)
+                    if buttons:
+                        logger.info("Found %s buttons with text selectors", len(buttons))
+                        all_buttons.extend(buttons)
             
             # Try text-based search for common button text
-            button_texts = ["clip coupon", "CLIP COUPON", "clip", "add coupon", "add offer"]
-            for text in button_texts:
-                try:
-                    # Try with exact text match
-                    xpath = f"//*[text()='{text}']"
-                    text_buttons = self.driver.find_elements(By.XPATH, xpath)
-                    if text_buttons:
-                        logger.info(f"Found {len(text_buttons)} buttons with exact text: '{text}'")
-                        all_buttons.extend(text_buttons)
-                        
-                    # Try with contains
-                    xpath = f"//*[contains(text(), '{text}')]"
-                    text_buttons = self.driver.find_elements(By.XPATH, xpath)
-                    if text_buttons:
-                        logger.info(f"Found {len(text_buttons)} buttons containing text: '{text}'")
-                        all_buttons.extend(text_buttons)
-                except Exception:
-                    pass
+            try:
+                text_buttons = self.driver.find_elements(By.XPATH, _COUPON_TEXT_XPATH)
+                if text_buttons:
+                    logger.info("Found %s buttons with common coupon button text", len(text_buttons))
+                    all_buttons.extend(text_buttons)
+            except Exception:
+                pass
             
             # Remove duplicates and keep only visible buttons
-            unique_buttons = []
-            button_ids = set()
+            unique_buttons = self._unique_visible_elements(all_buttons)
             
-            for button in all_buttons:
-                try:
-                    # Use the selenium internal ID to identify unique elements
-                    elem_id = button.id
-                    if elem_id not in button_ids:
-                        button_ids.add(elem_id)
-                        
-                        # Only include visible buttons
-                        if button.is_displayed():
-                            unique_buttons.append(button)
-                except Exception:
-                    pass
-            
-            logger.info(f"Found {len(unique_buttons)} unique coupon buttons")
+            logger.info("Found %s unique coupon buttons", len(unique_buttons))
             return unique_buttons
             
         except Exception as e:
-            logger.warning(f"Error in coupon button detection: {e}")
+            logger.warning("Error in coupon button detection: %s", e)
             return []
     
-    def _find_weis_buttons_directly(self):
+    def _unique_visible_elements(self, elements, enabled_only=False):
         """
-        Specialized function to find Weis coupon buttons directly by examining the page structure.
+        Remove duplicate and hidden elements in a single script call.
         
+        Args:
+            elements (list): WebElements, possibly with duplicates
+            enabled_only (bool): Whether to also remove disabled elements
+            
         Returns:
-            list: List of found coupon buttons
+            list: The first occurrence of each visible element, in the original order
         """
-        try:
-            buttons = []
-            
-            # Try several specific selectors known to work well for Weis
-            selectors = [
-                ".btn-clip:not(.added)",
-                ".coupon-add",
-                ".add-coupon",
-                "button[data-coupon-id]",
-                "button.coupon__btn",
-                "button.add"
-            ]
+        if not elements:
+            return []
             
-            for selector in selectors:
+        try:
+            kept = self.driver.execute_script("""
+                const seen = new Set(), out = [];
+                arguments[0].forEach((el, i) => {
+                    if (seen.has(el)) return;
+                    seen.add(el);
+                    if (arguments[1] && el.disabled) return;
+                    if (el.getClientRects().length && getComputedStyle(el).visibility !== 'hidden') out.push(i);
+                });
+                return out;
+            """, elements, enabled_only)
+            return [elements[i] for i in kept]
+        except Exception as e:
+            # A stale element fails the whole call, so check them one at a time - with one
+            # cheap script each rather than is_displayed() and is_enabled() round-trips
+            logger.debug("Bulk visibility check failed, checking elements individually: %s", e)
+            unique = []
+            seen_ids = set()
+            for element in elements:
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"Found {len(elements)} Weis buttons with selector: {selector}")
-                        buttons.extend(elements)
+                    if element.id not in seen_ids:
+                        seen_ids.add(element.id)
+                        if self.driver.execute_script(
+                            "const el = arguments[0]; return el.offsetParent !== null && !(arguments[1] && el.disabled);",
+                            element, enabled_only
+                        ):
+                            unique.append(element)
                 except Exception:
                     pass
+            return unique
+    
+    def _find_weis_buttons_directly(self):
+        """
+        Specialized function to find Weis coupon buttons directly by examining the page structure.
+        
+        Every strategy runs in a single script call: the Weis selectors and exact
+        'CLIP COUPON' text first, then a case-insensitive text match if those find nothing.
+        
+        Returns:
+            list: List of found coupon buttons
+        """
+        try:
+            buttons = self.driver.execute_script("""
+                function byXPath(xpath) {
+                    const result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    const out = [];
+                    for (let i = 0; i < result.snapshotLength; i++) out.push(result.snapshotItem(i));
+                    return out;
+                }
+                // Remove duplicates and only include visible buttons
+                const found = [...new Set([...document.querySelectorAll(arguments[0]), ...byXPath(arguments[1])])]
+                    .filter(el => el.getClientRects().length && getComputedStyle(el).visibility !== 'hidden');
+                return found.length ? found : byXPath(arguments[2]);
+            """, ", ".join(_WEIS_BUTTON_SELECTORS), *_text_button_xpath("CLIP COUPON")) or []
             
-            # Try to find buttons with specific text "CLIP COUPON" (common in Weis)
-            try:
-                # Exact match for "CLIP COUPON" text
-                xpath = "//*[text()='CLIP COUPON']"
-                text_buttons = self.driver.find_elements(By.XPATH, xpath)
-                if text_buttons:
-                    logger.info(f"Found {len(text_buttons)} buttons with exact text 'CLIP COUPON'")
-                    buttons.extend(text_buttons)
-            except Exception:
-                pass
-                
-            # If we've found a lot of buttons, filter them for uniqueness
-            if len(buttons) > 0:
-                # Remove duplicates
-                unique_buttons = []
-                button_ids = set()
-                
-                for button in buttons:
-                    try:
-                        elem_id = button.id
-                        if elem_id not in button_ids:
-                            button_ids.add(elem_id)
-                            
-                            # Only include visible buttons
-                            if button.is_displayed():
-                                unique_buttons.append(button)
-                    except Exception:
-                        pass
-                
-                logger.info(f"Found {len(unique_buttons)} unique Weis buttons")
-                return unique_buttons
-            
+            logger.info("Found %s Weis buttons", len(buttons))
             return buttons
             
         except Exception as e:
-            logger.error(f"Error in direct Weis button detection: {e}")
+            logger.error("Error in direct Weis button detection: %s", e)
             return []
     
     def _is_already_clipped(self, button, website_config):
         """
         Check if a coupon has already been clipped.
+        
+        Runs the same in-page check as _bulk_clipped_status, so it costs a single
+        round-trip rather than one per attribute read.
+        
+        Raises:
+            WebDriverException: If the button is stale or the driver fails, so the
+                caller can refresh its button list or check the connection
         """
         try:
-            # For Harris Teeter, check if the button text contains "Unclip"
-            button_text = button.text.lower()
-            if "unclip" in button_text:
-                logger.debug(f"Button is for unclipping, not clipping: '{button_text}'")
-                return True
+            return self.driver.execute_script(
+                _CLIPPED_STATUS_JS, [button], *website_config["_compiled"]["clipped_script_args"]
+            )[0]
+        except WebDriverException:
+            raise
+        except Exception as e:
+            logger.debug("Error checking if coupon is clipped: %s", e)
+            return False  # Assume not clipped if we can't determine
+    
+    def _bulk_clipped_status(self, buttons, website_config):
+        """
+        Check the clipped state of many buttons with a single script call.
+        
+        Applies the same checks as _is_already_clipped to the whole list at once, so a
+        long coupon list costs one round-trip instead of one per button.
+        
+        Args:
+            buttons (list): WebElement buttons to check
+            website_config (dict): Website configuration
             
-            # Check the button's class for clipped indicators
-            if "coupon_clipped_indicator" in website_config:
-                indicator_classes = website_config["coupon_clipped_indicator"].split(", ")
-                button_class = button.get_attribute("class") or ""
-                
-                for indicator_class in indicator_classes:
-                    # Skip empty indicators
-                    if not indicator_class.strip():
-                        continue
-                        
-                    # Check if this class indicator is present
-                    if indicator_class in button_class:
-                        return True
+        Returns:
+            dict: Button index to True if already clipped. Buttons that couldn't be
+            checked (e.g. stale ones) are left out, for the caller to check again
+        """
+        if not buttons:
+            return {}
             
-            # Check button text for common "clipped" indicators
-            clipped_terms = ["clipped", "added", "saved", "in cart", "remove"]
-            if any(term in button_text for term in clipped_terms):
-                return True
+        try:
+            return dict(enumerate(self.driver.execute_script(
+                _CLIPPED_STATUS_JS, buttons, *website_config["_compiled"]["clipped_script_args"]
+            )))
+        except Exception as e:
+            logger.debug("Bulk clipped check failed, checking buttons individually: %s", e)
             
-            # Check for disabled attribute
-            if button.get_attribute("disabled") == "true" or button.get_attribute("disabled") == "":
-                return True
+        statuses = {}
+        for idx, button in enumerate(buttons):
+            try:
+                statuses[idx] = self._is_already_clipped(button, website_config)
+            except WebDriverException as e:
+                logger.debug("Could not check button %s for clipped state: %s", idx, e)
+        return statuses
+    
+    def _rapid_clip_all(self, buttons, min_delay, max_delay, batch_size=20):
+        """
+        Click all the given buttons from inside the page with a random delay between clicks.
+        
+        Used in rapid mode so each batch of buttons costs one WebDriver call instead of
+        several per button. Batching keeps each call short, reports progress as it goes
+        and lets Ctrl+C interrupt between batches.
+        
+        Args:
+            buttons (list): WebElement buttons to click
+            min_delay (float): Minimum delay between clicks in seconds
+            max_delay (float): Maximum delay between clicks in seconds
+            batch_size (int): Number of buttons to click per call
             
-            # Check for aria-disabled attribute
-            if button.get_attribute("aria-disabled") == "true":
-                return True
-                
-            return False
-                
+        Returns:
+            int: Number of buttons clicked, or None if the first batch could not be run
+        """
+        if not buttons:
+            return 0
+            
+        logger.info("Rapid clipping %s coupons in the browser", len(buttons))
+        batch_size = max(1, batch_size)
+        clicked = 0
+        try:
+            # Allow enough time for every click in a batch plus some headroom
+            self.driver.set_script_timeout(batch_size * max_delay + 30)
+            for start in range(0, len(buttons), batch_size):
+                if start:
+                    time.sleep(random.uniform(min_delay, max_delay))
+                clicked += self.driver.execute_async_script("""
+                    const els = arguments[0], lo = arguments[1], hi = arguments[2];
+                    const done = arguments[arguments.length - 1];
+                    let i = 0, clicked = 0;
+                    function step() {
+                        if (i >= els.length) { done(clicked); return; }
+                        try { els[i].click(); clicked++; } catch (e) {}
+                        i++;
+                        if (i >= els.length) { done(clicked); return; }
+                        setTimeout(step, lo + Math.random() * (hi - lo));
+                    }
+                    step();
+                """, buttons[start:start + batch_size], int(min_delay * 1000), int(max_delay * 1000))
+                logger.info("Rapid clipped %s/%s coupons", clicked, len(buttons))
+            return clicked
         except Exception as e:
-            logger.debug(f"Error checking if coupon is clipped: {e}")
-            return False  # Assume not clipped if we can't determine
+            if not clicked:
+                logger.warning("Rapid clipping failed, clipping one by one: %s", e)
+                return None
+            # Some coupons are already clipped, so retrying one by one could unclip them
+            logger.warning("Rapid clipping stopped after %s coupons: %s", clicked, e)
+            return clicked
+        finally:
+            try:
+                self.driver.set_script_timeout(30)
+            except Exception:
+                pass
     
     def _click_button(self, button):
         """
         Attempt to click a button with retry logic for common issues.
+        
+        A stale button is not retried: StaleElementReferenceException is raised
+        so the caller can refresh its button list.
         """
         settings = self.config["settings"]
         max_retries = settings.get("max_retries", 3)
         
         for attempt in range(max_retries):
             try:
-                # First try to scroll the button into view
-                self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", button)
-                time.sleep(0.5)  # Brief pause after scrolling
+                # First make sure the button is in view, checking and scrolling in one call.
+                # Buttons already on screen aren't scrolled, and the jump is instant, so
+                # there's only a short pause for lazy-loaded content when it moved
+                scrolled = self.driver.execute_script("""
+                    const el = arguments[0], rect = el.getBoundingClientRect();
+                    if (rect.top >= 0 && rect.bottom <= window.innerHeight) return false;
+                    el.scrollIntoView({behavior: 'instant', block: 'center'});
+                    return true;
+                """, button)
+                if scrolled:
+                    time.sleep(0.1)
                 
                 # Try a regular click first
                 button.click()
@@ -1751,6 +2748,9 @@ class CouponClipper:
                 except Exception:
                     pass
                     
+            except StaleElementReferenceException:
+                raise
+                
             except Exception:
                 # Wait before retry
                 time.sleep(1)
@@ -1761,11 +2761,13 @@ class CouponClipper:
                 actions = ActionChains(self.driver)
                 actions.move_to_element(button).click().perform()
                 return True
+            except StaleElementReferenceException:
+                raise
             except Exception:
                 # If that fails too, wait and try next attempt
                 time.sleep(1)
                 
-        logger.warning(f"Failed to click button after {max_retries} attempts")
+        logger.warning("Failed to click button after %s attempts", max_retries)
         return False
         
     def _enhanced_click_button(self, button):
@@ -1778,28 +2780,28 @@ class CouponClipper:
             
         Returns:
             bool: True if successful, False otherwise
+            
+        Raises:
+            StaleElementReferenceException: If the button is no longer attached
         """
         # First, make sure the button is visible before trying to click
         try:
-            # Scroll the button into view, making sure it's centered
-            self.driver.execute_script("""
-                arguments[0].scrollIntoView({
-                    behavior: 'smooth',
-                    block: 'center',
-                    inline: 'center'
-                });
+            # Center the button in view and check it's visible, enabled and not too small
+            status = self.driver.execute_script("""
+                const el = arguments[0];
+                el.scrollIntoView({block: 'center', inline: 'center'});
+                const rect = el.getBoundingClientRect();
+                if (!el.getClientRects().length || getComputedStyle(el).visibility === 'hidden' || el.disabled) {
+                    return 'hidden';
+                }
+                if (rect.width < 5 || rect.height < 5) return 'small';
+                return 'ok';
             """, button)
-            time.sleep(0.5)  # Wait for smooth scroll
-            
-            # Verify button is visible and clickable
-            if not button.is_displayed() or not button.is_enabled():
+            if status == "hidden":
                 logger.debug("Button is not visible or enabled")
                 return False
-            
-            # Get button dimensions to make sure it's not too small
-            size = button.size
-            if size['width'] < 5 or size['height'] < 5:
-                logger.debug(f"Button is too small: {size}")
+            if status == "small":
+                logger.debug("Button is too small")
                 return False
             
             # Try multiple click techniques in sequence
@@ -1807,73 +2809,87 @@ class CouponClipper:
             # 1. Standard click
             try:
                 button.click()
-                time.sleep(0.5)
+                self._wait_for_click_effect(button)
                 return True
             except Exception as e:
-                logger.debug(f"Standard click failed: {e}")
+                logger.debug("Standard click failed: %s", e)
             
-            # 2. JavaScript click
+            # 2-4. JavaScript click, then a click at the button's center, then its parent,
+            # all tried inside the page in one call
             try:
-                self.driver.execute_script("arguments[0].click();", button)
-                time.sleep(0.5)
-                return True
+                method = self.driver.execute_script("""
+                    const el = arguments[0];
+                    try { el.click(); return 'javascript'; } catch (e) {}
+                    try {
+                        const rect = el.getBoundingClientRect();
+                        const target = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+                        if (target) {
+                            target.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true, view: window}));
+                            return 'coordinate';
+                        }
+                    } catch (e) {}
+                    try { el.parentElement.click(); return 'parent'; } catch (e) {}
+                    return null;
+                """, button)
+                if method:
+                    logger.debug("Clicked button with %s click", method)
+                    self._wait_for_click_effect(button)
+                    return True
             except Exception as e:
-                logger.debug(f"JavaScript click failed: {e}")
+                logger.debug("JavaScript click failed: %s", e)
             
-            # 3. Action chains with move and click
+            # 5. Action chains with move and click
             try:
                 actions = ActionChains(self.driver)
                 actions.move_to_element(button).click().perform()
-                time.sleep(0.5)
-                return True
-            except Exception as e:
-                logger.debug(f"ActionChains click failed: {e}")
-            
-            # 4. Try clicking the center of the button with coordinates
-            try:
-                rect = self.driver.execute_script("""
-                    var rect = arguments[0].getBoundingClientRect();
-                    return {
-                        left: rect.left,
-                        top: rect.top,
-                        width: rect.width,
-                        height: rect.height
-                    };
-                """, button)
-                
-                center_x = rect['left'] + rect['width'] / 2
-                center_y = rect['top'] + rect['height'] / 2
-                
-                # Use ActionChains to move to coordinates and click
-                actions = ActionChains(self.driver)
-                actions.move_by_offset(center_x, center_y).click().perform()
-                time.sleep(0.5)
-                return True
-            except Exception as e:
-                logger.debug(f"Coordinate click failed: {e}")
-            
-            # 5. Try to get parent element and click it instead
-            try:
-                parent = button.find_element(By.XPATH, "..")
-                self.driver.execute_script("arguments[0].click();", parent)
-                time.sleep(0.5)
+                self._wait_for_click_effect(button)
                 return True
             except Exception as e:
-                logger.debug(f"Parent click failed: {e}")
+                logger.debug("ActionChains click failed: %s", e)
             
             # 6. Send Enter key as last resort
             try:
                 button.send_keys(Keys.ENTER)
-                time.sleep(0.5)
+                self._wait_for_click_effect(button)
                 return True
             except Exception as e:
-                logger.debug(f"Enter key failed: {e}")
+                logger.debug("Enter key failed: %s", e)
             
             logger.warning("All click techniques failed")
             return False
             
+        except StaleElementReferenceException:
+            # Let the caller refresh its button list
+            raise
         except Exception as e:
-            logger.warning(f"Error in enhanced button click: {e}")
+            logger.warning("Error in enhanced button click: %s", e)
+            return False
+        
+    def _wait_for_click_effect(self, button, timeout_ms=500):
+        """
+        Wait for a clicked button to react, instead of sleeping a fixed amount.
+        
+        Returns as soon as the button's class or disabled state changes, or after
+        the timeout if nothing changes.
+        
+        Args:
+            button: The WebElement that was just clicked
+            timeout_ms (int): Maximum time to wait in milliseconds
+            
+        Returns:
+            bool: True if the button changed, False otherwise
+        """
+        try:
+            return bool(self.driver.execute_async_script("""
+                const el = arguments[0], timeoutMs = arguments[1];
+                const done = arguments[arguments.length - 1];
+                const mo = new MutationObserver(() => { mo.disconnect(); done(true); });
+                mo.observe(el, {attributes: true, attributeFilter: ['class', 'disabled', 'aria-disabled']});
+                setTimeout(() => { mo.disconnect(); done(false); }, timeoutMs);
+            """, button, timeout_ms))
+        except WebDriverException as e:
+            # The button may have been replaced or removed by the click itself
+            logger.debug("Could not watch button after click: %s", e)
             return False
         
     def _is_rate_limited(self, website_config, settings):
@@ -1892,88 +2908,139 @@ class CouponClipper:
             return False
         
         detected = False
-        context = None
+        main_content_only = settings.get("rate_limit_check_main_content_only", True)
         
         try:
-            # First, check if we're only looking at main content
-            if settings.get("rate_limit_check_main_content_only", True):
+            # The whole check runs inside the page; only the matching phrase comes back
+            indicators, phrases = website_config["_compiled"]["rate_limit_script_args"]
+            if main_content_only:
                 # Focus on the main content areas to avoid false positives in footers, etc.
-                main_selectors = ["main", "#main", ".main-content", "#content", ".content", "article"]
-                main_content = None
-                
-                for selector in main_selectors:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and any(e.is_displayed() for e in elements):
-                        main_content = next(e for e in elements if e.is_displayed())
-                        break
-                
-                if main_content:
-                    context = main_content
-                else:
-                    # Fallback to the entire body if no main content area found
-                    context = self.driver.find_element(By.TAG_NAME, "body")
+                # Falls back to the entire body if no main content area is visible.
+                # Generic phrases are only checked here, not against the whole page
+                scope = _RATE_LIMIT_SCOPE
             else:
-                # Check the entire page source
-                context = self.driver.page_source
-            
-            # Look for rate limit indicators in the appropriate context
-            for indicator in website_config.get("rate_limit_indicators", []):
-                if context == self.driver.page_source:
-                    # If checking the page source
-                    if indicator in context:
-                        logger.warning(f"Rate limit indicator found in page source: '{indicator}'")
-                        detected = True
-                        break
-                else:
-                    # If checking an element
-                    context_text = context.text.lower()
-                    if indicator.lower() in context_text:
-                        logger.warning(f"Rate limit indicator found in main content: '{indicator}'")
-                        detected = True
-                        break
+                # Check the text of the entire page, for site indicators only
+                scope = "body"
+                phrases = []
+                if not indicators:
+                    return False
+                    
+            found = self._cdp_eval(_RATE_LIMIT_CHECK_JS, scope, indicators, phrases) or {}
+            
+            if "indicator" in found:
+                where = "main content" if main_content_only else "page text"
+                logger.warning("Rate limit indicator found in %s: '%s'", where, found["indicator"])
+                detected = True
             
             # If no specific indicators found, check for generic phrases that might indicate rate limiting
-            if not detected and context != self.driver.page_source:
-                # These are more specific phrases than "please try again later" to avoid false positives
-                rate_limit_phrases = [
-                    "rate limit",
-                    "too many requests",
-                    "too many attempts",
-                    "try again later",
-                    "temporarily blocked"
-                ]
-                
-                context_text = context.text.lower()
-                matched_phrase = None
-                
-                for phrase in rate_limit_phrases:
-                    if phrase in context_text:
-                        matched_phrase = phrase
-                        break
-                        
+            if not detected and main_content_only:
+                # Only count sightings from the last rate_limit_window seconds, so a phrase
+                # that flickers in and out still adds up while old ones expire
+                now = time.time()
+                window = settings.get("rate_limit_window", 60)
+                times = self.rate_limit_times
+                while times and now - times[0] > window:
+                    times.popleft()
+                    
+                matched_phrase = found.get("phrase")
                 if matched_phrase:
                     # If we found a common phrase, increase our count
-                    self.rate_limit_count += 1
-                    logger.warning(f"Potential rate limit phrase detected: '{matched_phrase}' (count: {self.rate_limit_count})")
+                    times.append(now)
+                    logger.warning("Potential rate limit phrase detected: '%s' (count: %s)", matched_phrase, len(times))
                     
                     # Only consider it a true rate limit if we've seen multiple indications
                     threshold = settings.get("rate_limit_threshold", 3)
-                    if self.rate_limit_count >= threshold:
-                        logger.warning(f"Rate limit threshold reached ({threshold})")
+                    if len(times) >= threshold:
+                        logger.warning("Rate limit threshold reached (%s)", threshold)
                         detected = True
                     else:
                         # Not enough occurrences yet to consider it a rate limit
-                        logger.info(f"Below rate limit threshold ({self.rate_limit_count}/{threshold})")
-                else:
-                    # Reset the count if we don't see a phrase this time
-                    self.rate_limit_count = 0
+                        logger.info("Below rate limit threshold (%s/%s)", len(times), threshold)
             
             return detected
                 
         except Exception as e:
-            logger.error(f"Error checking for rate limiting: {e}")
+            logger.error("Error checking for rate limiting: %s", e)
             return False
         
+    def _cdp_eval(self, script, *args):
+        """
+        Run a script through the Chrome DevTools Protocol, skipping the WebDriver script endpoint.
+        
+        Only for scripts whose arguments are plain JSON values (not elements); they're
+        inlined into the expression. Falls back to execute_script on drivers without
+        DevTools support, and for single calls that fail for other reasons.
+        
+        Args:
+            script (str): Function body using arguments[n], as for execute_script
+            *args: JSON-serializable arguments
+            
+        Returns:
+            The script's return value
+        """
+        if self._cdp_available:
+            expression = f"(function() {{ {script} }}).apply(null, {json.dumps(args)})"
+            try:
+                result = self.driver.execute_cdp_cmd(
+                    "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+                )
+            except AttributeError as e:
+                logger.debug("DevTools evaluation unavailable, using execute_script: %s", e)
+                self._cdp_available = False
+            except WebDriverException as e:
+                # Only give up on DevTools for the session if the command isn't supported;
+                # anything else (e.g. the page navigating mid-call) just falls back this once
+                if any(marker in str(e).lower() for marker in _CDP_UNSUPPORTED_MARKERS):
+                    logger.debug("DevTools evaluation unavailable, using execute_script: %s", e)
+                    self._cdp_available = False
+                else:
+                    logger.debug("DevTools evaluation failed, using execute_script: %s", e)
+            else:
+                if "exceptionDetails" in result:
+                    details = result["exceptionDetails"]
+                    raise WebDriverException(details.get("exception", {}).get("description") or details.get("text"))
+                return result["result"].get("value")
+                
+        return self.driver.execute_script(script, *args)
+        
+    def _page_fingerprint(self, selector="button"):
+        """
+        Get a cheap signature of the page that changes when content is added or removed.
+        
+        Args:
+            selector (str): CSS selector for the elements to count
+            
+        Returns:
+            tuple: (scroll height, matching element count), or None if the page couldn't be read
+        """
+        try:
+            return tuple(self._cdp_eval(
+                "return [document.body ? document.body.scrollHeight : 0, document.querySelectorAll(arguments[0]).length]",
+                selector
+            ))
+        except Exception as e:
+            logger.debug("Could not fingerprint page: %s", e)
+            return None
+        
+    def _wait_for_fingerprint_change(self, fingerprint, timeout=3, poll_frequency=0.25):
+        """
+        Wait for the page fingerprint to differ from the given one.
+        
+        Args:
+            fingerprint (tuple): Fingerprint to compare against
+            timeout (float): Maximum number of seconds to wait
+            poll_frequency (float): Seconds between checks
+            
+        Returns:
+            tuple: The last fingerprint seen, which equals the given one on timeout
+        """
+        deadline = time.time() + timeout
+        while True:
+            current = self._page_fingerprint()
+            if current != fingerprint or time.time() >= deadline:
+                return current
+            time.sleep(poll_frequency)
+        
     def _handle_rate_limit(self, settings):
         """
         Handle rate limiting with more gradual backoff.
@@ -1985,10 +3052,19 @@ class CouponClipper:
         backoff_factor = settings.get("rate_limit_backoff_factor", 1.5)
         max_backoff = settings.get("max_backoff_time", 30)
         
-        wait_time = min(max_backoff, self.backoff_time)
+        # Wait a random amount between half and all of the backoff time, so retries
+        # don't land at the same moment every time
+        base = min(max_backoff, self.backoff_time)
+        wait_time = random.uniform(base * 0.5, base)
+        
+        # If the site said how long to wait, wait at least that long (within the maximum)
+        retry_after = self._read_retry_after()
+        if retry_after is not None:
+            logger.debug("Site asked to retry after %.1f seconds", retry_after)
+            wait_time = max(wait_time, min(max_backoff, retry_after))
         
-        logger.info(f"Rate limited. Backing off for {wait_time} seconds")
-        print(f"\nRate limit detected. Waiting {wait_time} seconds before continuing...")
+        logger.info("Rate limited. Backing off for %.1f seconds", wait_time)
+        print(f"\nRate limit detected. Waiting {wait_time:.1f} seconds before continuing...")
         time.sleep(wait_time)
         
         # Increase backoff for next time, but less aggressively
@@ -2002,6 +3078,37 @@ class CouponClipper:
         # Return True to indicate page was refreshed and buttons should be re-found
         return True
     
+    def _read_retry_after(self):
+        """
+        Get the Retry-After time the site last sent with a 429 or 503 response, and clear it.
+        
+        Returns:
+            float: Seconds to wait, or None if the site didn't say
+        """
+        try:
+            value = self._cdp_eval("""
+                const value = window.__couponClipperRetryAfter || null;
+                window.__couponClipperRetryAfter = null;
+                return value;
+            """)
+        except WebDriverException as e:
+            logger.debug("Could not read Retry-After: %s", e)
+            return None
+        if not value:
+            return None
+            
+        # Either a number of seconds or an HTTP date
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.debug("Unrecognized Retry-After value: %s", value)
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+    
     def _ask_user_to_identify_button(self):
         """
         Ask the user to help identify a coupon button when automatic detection fails.
@@ -2016,9 +3123,13 @@ class CouponClipper:
         print("="*50)
         
         try:
-            choice = input("Enter your choice (1-2, default: 1): ") or "1"
+            # Don't leave an unattended run stuck on this website
+            choice = _timed_input("Enter your choice (1-2, default: 1): ", 60)
+            if choice is None:
+                print("No answer, skipping this website.")
+                return []
             
-            if choice == "2":
+            if (choice or "1") == "2":
                 return []
             
             print("\nPlease look at the webpage and tell me what to click.")
@@ -2044,14 +3155,8 @@ class CouponClipper:
             else:
                 button_text = input("Enter the text on the button: ")
                 try:
-                    # Try exact text match first
-                    xpath = f"//*[text()='{button_text}']"
-                    buttons = self.driver.find_elements(By.XPATH, xpath)
-                    
-                    if not buttons:
-                        # Try case-insensitive XPath text match
-                        xpath = f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{button_text.lower()}')]"
-                        buttons = self.driver.find_elements(By.XPATH, xpath)
+                    # Exact text match, falling back to a case-insensitive partial match, in one script call
+                    buttons = self.driver.execute_script(_XPATH_FALLBACK_JS, *_text_button_xpath(button_text)) or []
                         
                     if buttons:
                         logger.info(f"Found {len(buttons)} buttons with text containing: {button_text}")
@@ -2114,15 +3219,20 @@ class CouponClipper:
             return 'c'  # Continue
         
     def close(self):
-        """Close the WebDriver when finished."""
-        if not self.driver:
-            return
-            
-        try:
-            self.driver.quit()
-            logger.info("WebDriver closed successfully")
-        except Exception as e:
-            logger.error(f"Error closing WebDriver: {e}")
+        """Close the WebDriver and the chromedriver service when finished."""
+        if self.driver:
+            try:
+                self.driver.quit()
+                logger.info("WebDriver closed successfully")
+            except Exception as e:
+                logger.error(f"Error closing WebDriver: {e}")
+                
+        if self._service:
+            try:
+                self._service.shutdown()
+            except Exception as e:
+                logger.error(f"Error stopping chromedriver: {e}")
+            self._service = None
 
 def main():
     """Main entry point for the coupon clipper program."""
@@ -2162,10 +3272,21 @@ def main():
             print("\nAvailable websites:")
             for i, website in enumerate(clipper.config["websites"].keys(), 1):
                 print(f"{i}. {website}")
+            print("A. All websites")
                 
+            websites = list(clipper.config["websites"].keys())
+            
             # Ask which website to use
+            selection = input("\nSelect website number, A for all (or 0 to exit): ").strip()
+            if selection.lower() == "a":
+                try:
+                    clipper.clip_all(websites)
+                except KeyboardInterrupt:
+                    print("\nOperation interrupted by user.")
+                continue
+                
             try:
-                website_idx = int(input("\nSelect website number (or 0 to exit): ")) - 1
+                website_idx = int(selection) - 1
             except ValueError:
                 print("Invalid input. Please enter a number.")
                 continue
@@ -2173,7 +3294,6 @@ def main():
             if website_idx == -1:
                 break
                 
-            websites = list(clipper.config["websites"].keys())
             
             if 0 <= website_idx < len(websites):
                 selected_website = websites[website_idx]